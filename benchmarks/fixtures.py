@@ -0,0 +1,185 @@
+"""
+Benchmark Fixtures
+Deterministic HTML fixtures for every tender platform and the documentation
+page, plus recording of live pages for replay.
+"""
+
+import os
+import re
+import json
+import zlib
+import random
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+FILLER = (
+    "закупівля постачання послуги ремонт обслуговування державного підприємства "
+    "відповідно до технічних вимог замовника з доставкою та монтажем на об'єкті "
+    "у місті протягом строку дії договору гарантійне обслуговування запасні частини "
+    "оплата після поставки кількість одиниць код ДК 021:2015 очікувана вартість"
+).split()
+
+DOCS_SELECTOR = "#fern-docs > main > div > article"
+
+
+def slug(name: str) -> str:
+    """File and URL friendly form of a platform name."""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-')
+
+
+def _class_name(selector: Optional[str], default: str) -> str:
+    """Class name of a simple '.class' selector."""
+    match = re.fullmatch(r'\s*\.([\w-]+)\s*', selector or '')
+    return match.group(1) if match else default
+
+
+def _item_text(rng: random.Random, keywords: List[str], words: int) -> str:
+    """Filler text, with a keyword in roughly one item in four."""
+    text = [rng.choice(FILLER) for _ in range(words)]
+    if rng.random() < 0.25:
+        text.insert(rng.randrange(len(text)), rng.choice(keywords))
+    return ' '.join(text)
+
+
+def listing_html(platform: Dict[str, Any], keywords: List[str], round_: int,
+                 items: int = 60, new_per_round: int = 3) -> str:
+    """
+    Synthetic listing page for a platform.
+
+    Each round publishes `new_per_round` new tenders on top of the listing,
+    like a real platform. Item content depends only on the platform and item
+    id, so every run produces identical pages.
+
+    Args:
+        platform: Platform configuration dictionary
+        keywords: Keywords to sprinkle into some items
+        round_: Listing revision
+        items: Items per page
+        new_per_round: Items added per revision
+
+    Returns:
+        HTML page
+    """
+    item_class = _class_name(platform['selector'], 'tender-item')
+    title_class = _class_name(platform.get('title_selector'), 'tender-title')
+    description_class = _class_name(platform.get('description_selector'), 'tender-description')
+    platform_seed = zlib.crc32(platform['name'].encode('utf-8'))
+
+    newest = 10_000 + round_ * new_per_round
+    rows = []
+    for item_id in range(newest, newest - items, -1):
+        rng = random.Random(platform_seed * 100_003 + item_id)
+        title = _item_text(rng, keywords, 8)
+        description = _item_text(rng, keywords, 40)
+        rows.append(
+            f'<div class="{item_class}" data-id="{item_id}">'
+            f'<a href="/tender/{slug(platform["name"])}/{item_id}">'
+            f'<h3 class="{title_class}">{title}</h3></a>'
+            f'<p class="{description_class}">{description}</p>'
+            f'<span class="tender-meta">UA-2026-{item_id:06d}</span></div>'
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{platform['name']}</title></head><body>"
+        "<header><nav><a href='/'>Головна</a><a href='/tenders'>Тендери</a></nav></header>"
+        f"<main><section class='listing'>{''.join(rows)}</section></main>"
+        "<footer>© fixture</footer></body></html>"
+    )
+
+
+def docs_html(round_: int, sections: int = 40) -> str:
+    """
+    Synthetic documentation page matching the scraper's default selector.
+
+    One section changes per round; the rest stays identical.
+
+    Args:
+        round_: Page revision
+        sections: Number of h2 sections
+
+    Returns:
+        HTML page
+    """
+    rng = random.Random(0xD0C5)
+    parts = ["<h1>WebSocket channels</h1><p>Subscribe to real-time market data.</p>"]
+    for index in range(sections):
+        name = f"channel_{index}"
+        revision = round_ if index == round_ % sections else 0
+        words = ' '.join(rng.choice(['market', 'order', 'trade', 'price', 'size', 'update', 'stream'])
+                         for _ in range(60))
+        parts.append(
+            f"<h2>{name}</h2><p>{words} (rev {revision})</p>"
+            f"<pre><code class='language-json'>{{\"method\": \"subscribe\", "
+            f"\"params\": {{\"channel\": \"{name}\"}}}}</code></pre>"
+            "<table><tr><th>Field</th><th>Type</th><th>Description</th></tr>"
+            + ''.join(f"<tr><td>field_{i}</td><td>string</td><td>{words[:40]}</td></tr>" for i in range(6))
+            + "</table><ul><li>Rate limit: 10/s</li><li>Snapshot on subscribe</li></ul>"
+        )
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Docs</title></head><body>"
+        "<div id='fern-docs'><nav>" + ''.join(f"<a href='#channel_{i}'>channel_{i}</a>" for i in range(sections))
+        + f"</nav><main><div><article>{''.join(parts)}</article></div></main></div></body></html>"
+    )
+
+
+def recorded(name: str) -> Optional[str]:
+    """Recorded HTML for a platform or 'docs', if one was saved."""
+    path = os.path.join(FIXTURE_DIR, f"{slug(name)}.html")
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    return None
+
+
+def record(platforms: List[Dict[str, Any]], docs_url: Optional[str] = None, timeout: float = 30) -> List[str]:
+    """
+    Save the live pages as fixtures; later runs serve them instead of synthetic pages.
+
+    Pages rendered by JavaScript only contain the shell. When the platform
+    selector matches nothing the page is not saved, any earlier recording
+    is removed, and the platform keeps using its synthetic fixture.
+
+    Args:
+        platforms: Platform configuration dictionaries
+        docs_url: Documentation page to record as 'docs'
+        timeout: Request timeout in seconds
+
+    Returns:
+        Names of the recorded fixtures
+    """
+    from bs4 import BeautifulSoup
+
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    targets = [(platform['name'], platform['url'], platform['selector']) for platform in platforms]
+    if docs_url:
+        targets.append(('docs', docs_url, DOCS_SELECTOR))
+
+    saved = []
+    for name, url, selector in targets:
+        request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (benchmark recorder)'})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as resp:
+                body = resp.read().decode(resp.headers.get_content_charset() or 'utf-8', errors='replace')
+        except OSError as e:
+            print(f"⚠️ Could not record {name}: {str(e)}")
+            continue
+        path = os.path.join(FIXTURE_DIR, f"{slug(name)}.html")
+        if not BeautifulSoup(body, 'html.parser').select_one(selector):
+            print(f"⚠️ {name}: nothing matches {selector!r} (rendered by JavaScript?), "
+                  f"using the synthetic fixture")
+            if os.path.exists(path):
+                os.remove(path)
+            continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(body)
+        saved.append(name)
+    return saved
+
+
+def load_keywords(path: str) -> List[str]:
+    """Flat list of keywords from keywords.json."""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [keyword for group in data.values() for keyword in group]
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+Drives the tender monitor and documentation extraction code paths against the
+local fixture server and reports throughput, latency and memory.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import math
+import asyncio
+import logging
+import platform
+import argparse
+import tempfile
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+import fixtures
+from server import FixtureServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TENDER_DIR = os.path.join(ROOT, "tender-monitoring-system")
+SCRAPERS_SRC = os.path.join(ROOT, "web-scrapers", "src")
+SHARED_DIR = os.path.join(ROOT, "shared")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+sys.path.insert(0, os.path.join(TENDER_DIR, "src"))
+sys.path.insert(1, SCRAPERS_SRC)
+sys.path.insert(2, SHARED_DIR)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+def process_rss_mb() -> float:
+    """Resident memory of this process in MiB."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2 ** 20
+    except ImportError:
+        pass
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def per_call_us(func: Callable[[str], Any], texts: List[str], min_time: float = 0.3) -> float:
+    """Average microseconds per call of func over texts, repeated for at least min_time."""
+    calls, started = 0, time.perf_counter()
+    while True:
+        for text in texts:
+            func(text)
+        calls += len(texts)
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / calls * 1e6
+
+
+def latency_stats(prefix: str, seconds: List[float]) -> Dict[str, float]:
+    """p50/p99/max of latencies in milliseconds."""
+    return {
+        f"{prefix}_p50_ms": round(percentile(seconds, 50) * 1000, 3),
+        f"{prefix}_p99_ms": round(percentile(seconds, 99) * 1000, 3),
+        f"{prefix}_max_ms": round(max(seconds) * 1000, 3)
+    }
+
+
+class NullBot:
+    """Stands in for the Telegram bot; the benchmark never starts the sender."""
+
+    async def send_message(self, **kwargs) -> None:
+        pass
+
+
+def bench_tender(base_url: str, rounds: int, use_browser: bool, state_dir: str) -> Dict[str, Any]:
+    """
+    Run TenderMonitor.check_platform for every platform, `rounds` times.
+
+    Args:
+        base_url: Fixture server URL
+        rounds: Checks per platform
+        use_browser: Load listings through the browser pool instead of HTTP
+        state_dir: Directory for the seen-tender store and outbox
+
+    Returns:
+        Metrics and run information
+    """
+    os.environ.setdefault('TELEGRAM_BOT_TOKEN', '0:benchmark')
+    os.environ.setdefault('TELEGRAM_CHAT_ID', 'benchmark')
+    import tender_monitor as tm
+    from near_duplicates import minhash
+    from listing import parse_listing
+
+    class BenchmarkMonitor(tm.TenderMonitor):
+        """TenderMonitor pointed at the fixture server, with a silent notifier."""
+
+        def _load_config(self) -> None:
+            super()._load_config()
+            mode = 'browser' if use_browser else 'http'
+            self.platforms = [
+                dict(p, url=f"{base_url}/platform/{fixtures.slug(p['name'])}", fetch_mode=mode)
+                for p in self.platforms
+            ]
+            # Every platform is its own host in production
+            self.settings['http_connections_per_host'] = len(self.platforms)
+            self.state_path = os.path.join(state_dir, 'tender_state.db')
+
+        def _setup_drivers(self) -> None:
+            if use_browser:
+                super()._setup_drivers()
+                return
+            self.driver_pool = None
+            self.executor = ThreadPoolExecutor(max_workers=1)
+            self.listing_hashes = {}
+            self.scheduler = tm.PollingScheduler(self.platforms, self.settings)
+            self.stats = Counter()
+            self.http = tm.HttpFetcher(timeout=30, limit_per_host=len(self.platforms))
+
+        def _setup_telegram(self) -> None:
+            self.notifier = tm.TelegramNotifier(NullBot(), 'benchmark', self.state_path)
+
+        def cleanup(self) -> None:
+            if self.driver_pool is not None:
+                self.driver_pool.close()
+            self.executor.shutdown(wait=False)
+            self.seen_tenders.close()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    cwd = os.getcwd()
+    os.chdir(TENDER_DIR)
+    try:
+        monitor = BenchmarkMonitor()
+    finally:
+        os.chdir(cwd)
+
+    latencies: List[float] = []
+    outcomes: Counter = Counter()
+
+    async def timed_check(platform_config: Dict[str, Any]) -> None:
+        started = time.perf_counter()
+        outcome = await monitor.check_platform(platform_config)
+        latencies.append(time.perf_counter() - started)
+        outcomes[outcome] += 1
+
+    async def run() -> float:
+        await monitor.http.start()
+        try:
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await asyncio.gather(*(timed_check(p) for p in monitor.platforms))
+            return time.perf_counter() - started
+        finally:
+            await monitor.http.close()
+
+    browser_rss = []
+    try:
+        elapsed = asyncio.run(run())
+        if use_browser:
+            from driver_factory import browser_rss_mb
+            browser_rss = [rss for rss in map(browser_rss_mb, monitor.driver_pool.drivers) if rss]
+    finally:
+        queued = monitor.notifier.pending()
+        monitor.notifier.connection.close()
+        monitor.cleanup()
+
+    # Keyword matching and parsing, isolated from I/O
+    keywords = fixtures.load_keywords(os.path.join(TENDER_DIR, 'config', 'keywords.json'))
+    pages = [(p, fixtures.listing_html(p, keywords, 0)) for p in monitor.platforms]
+    started = time.perf_counter()
+    items = [item for p, html in pages for item in parse_listing(html, p)]
+    parse_ms = (time.perf_counter() - started) / len(pages) * 1000
+    texts = [item.text for item in items]
+
+    checks = len(latencies)
+    metrics = {
+        'checks_per_s': round(checks / elapsed, 2),
+        **latency_stats('check', latencies),
+        'parse_ms_per_listing': round(parse_ms, 3),
+        'keyword_match_us_per_item': round(per_call_us(monitor.matcher.match_keywords, texts), 2),
+        'minhash_us_per_item': round(per_call_us(minhash, texts), 2),
+        'rss_mb_process': round(process_rss_mb(), 1)
+    }
+    if browser_rss:
+        metrics['rss_mb_per_browser'] = round(sum(browser_rss) / len(browser_rss), 1)
+    return {
+        'metrics': metrics,
+        'info': {
+            'mode': 'browser' if use_browser else 'http',
+            'platforms': len(monitor.platforms),
+            'checks': checks,
+            'outcomes': dict(outcomes),
+            'items_per_listing': len(items) // len(pages),
+            'notifications_queued': queued
+        }
+    }
+
+
+def bench_docs(base_url: str, rounds: int, use_browser: bool, state_dir: str) -> Dict[str, Any]:
+    """
+    Time documentation extraction: HTML to Markdown, history append and,
+    optionally, the browser read of the content extractor.
+
+    Args:
+        base_url: Fixture server URL
+        rounds: Page revisions to process
+        use_browser: Also measure ContentExtractor.extract() in Chrome
+        state_dir: Directory for the snapshot history
+
+    Returns:
+        Metrics and run information
+    """
+    from structured_content import extract_document
+    from snapshot_store import SnapshotStore
+
+    url = f"{base_url}/docs"
+    article = re.compile(r'<article>.*</article>', re.S)
+    pages = []
+    for _ in range(rounds):
+        with urllib.request.urlopen(url) as resp:
+            html = resp.read().decode('utf-8')
+        match = article.search(html)
+        pages.append(match.group(0) if match else html)
+
+    convert, append = [], []
+    store = SnapshotStore(os.path.join(state_dir, 'docs.jsonl'))
+    for html in pages:
+        started = time.perf_counter()
+        document = extract_document(html, url)
+        convert.append(time.perf_counter() - started)
+        started = time.perf_counter()
+        store.append(document.markdown)
+        append.append(time.perf_counter() - started)
+
+    metrics = {
+        'convert_pages_per_s': round(len(convert) / sum(convert), 2),
+        **latency_stats('convert', convert),
+        **latency_stats('history_append', append),
+        'history_bytes_per_version': round(os.path.getsize(store.path) / max(1, len(store)))
+    }
+
+    if use_browser:
+        from content_extractor import ContentExtractor
+        from driver_factory import browser_rss_mb
+        extractor = ContentExtractor(url, fixtures.DOCS_SELECTOR)
+        extractor.start()
+        try:
+            reads = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                extractor.extract()
+                reads.append(time.perf_counter() - started)
+            metrics.update(latency_stats('browser_extract', reads))
+            rss = browser_rss_mb(extractor.session.driver)
+            if rss:
+                metrics['rss_mb_per_browser'] = round(rss, 1)
+        finally:
+            extractor.stop()
+
+    return {
+        'metrics': metrics,
+        'info': {'versions': len(store), 'markdown_chars': len(document.markdown)}
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print metric changes against a previous run.
+
+    Throughput metrics (`*_per_s`) should not drop, everything else should
+    not grow, by more than `threshold` percent.
+
+    Args:
+        current: Results of this run
+        baseline: Results of the previous run
+        threshold: Allowed change in percent
+
+    Returns:
+        Names of regressed metrics
+    """
+    regressions = []
+    for suite, result in current['suites'].items():
+        previous = baseline.get('suites', {}).get(suite, {}).get('metrics', {})
+        for name, value in result['metrics'].items():
+            if name not in previous or not previous[name]:
+                continue
+            change = (value - previous[name]) / previous[name] * 100
+            worse = -change if name.endswith('_per_s') else change
+            flag = '❌' if worse > threshold else '  '
+            if worse > threshold:
+                regressions.append(f"{suite}.{name}")
+            print(f"{flag} {suite}.{name:<28} {previous[name]:>12} → {value:<12} ({change:+.1f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the scraping paths.")
+    parser.add_argument('--suite', choices=['all', 'tender', 'docs'], default='all')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--items', type=int, default=60, help="items per synthetic listing")
+    parser.add_argument('--change-every', type=int, default=2, help="requests per page revision")
+    parser.add_argument('--browser', action='store_true', help="also drive Chrome (needs chromedriver)")
+    parser.add_argument('--output', default=None, help="results file, default benchmarks/results/<time>.json")
+    parser.add_argument('--compare', default=None, help="previous results file to compare against")
+    parser.add_argument('--threshold', type=float, default=10.0, help="regression threshold in percent")
+    parser.add_argument('--record', action='store_true', help="record live pages as fixtures and exit")
+    args = parser.parse_args(argv)
+
+    with open(os.path.join(TENDER_DIR, 'config', 'platforms.json'), 'r', encoding='utf-8') as f:
+        platforms = json.load(f)['platforms']
+
+    if args.record:
+        saved = fixtures.record(platforms, "https://docs.paradex.trade/ws/web-socket-channels/")
+        print(f"✅ Recorded {len(saved)} fixtures in {fixtures.FIXTURE_DIR}")
+        return 0
+
+    keywords = fixtures.load_keywords(os.path.join(TENDER_DIR, 'config', 'keywords.json'))
+    server = FixtureServer(platforms, keywords, args.items, args.change_every)
+    base_url = server.start()
+
+    results = {
+        'meta': {
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': f"{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs",
+            'rounds': args.rounds,
+            'items': args.items,
+            'change_every': args.change_every,
+            'browser': args.browser
+        },
+        'suites': {}
+    }
+    suites = {'tender': bench_tender, 'docs': bench_docs}
+    try:
+        with tempfile.TemporaryDirectory() as state_dir:
+            for name, bench in suites.items():
+                if args.suite in ('all', name):
+                    server.requests.clear()
+                    print(f"⏱️ Running {name} benchmark...")
+                    results['suites'][name] = bench(base_url, args.rounds, args.browser, state_dir)
+    finally:
+        server.stop()
+
+    for name, result in results['suites'].items():
+        print(f"\n📊 {name}")
+        for metric, value in result['metrics'].items():
+            print(f"   {metric:<30} {value}")
+        print(f"   {json.dumps(result['info'], ensure_ascii=False)}")
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("%Y%m%d_%H%M%S") + ".json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"\n✅ Results saved to: {output}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\n🔍 Compared with {args.compare}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Fixture Server
+Local HTTP server that serves benchmark fixtures with ETag revalidation.
+"""
+
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+import fixtures
+
+
+class FixtureServer:
+    """
+    Serves every platform listing at /platform/<slug> and the docs page at /docs.
+
+    A page moves to its next revision every `change_every` requests, so a
+    run sees a realistic mix of changed, unchanged (304) and new listings.
+    Recorded fixtures are served as they are and never change.
+    """
+
+    def __init__(self, platforms: List[Dict[str, Any]], keywords: List[str],
+                 items: int = 60, change_every: int = 2):
+        """
+        Args:
+            platforms: Platform configuration dictionaries
+            keywords: Keywords used in synthetic listings
+            items: Items per synthetic listing
+            change_every: Requests per page revision
+        """
+        self.platforms = {fixtures.slug(p['name']): p for p in platforms}
+        self.keywords = keywords
+        self.items = items
+        self.change_every = max(1, change_every)
+        self.requests: Counter = Counter()
+        self._lock = threading.Lock()
+        self._cache: Dict[tuple, bytes] = {}
+        self._httpd: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, path: str) -> Optional[tuple]:
+        """
+        Body and ETag for a path at its current revision.
+
+        Args:
+            path: Request path
+
+        Returns:
+            (body, etag), or None for unknown paths
+        """
+        with self._lock:
+            count = self.requests[path]
+            self.requests[path] += 1
+        revision = count // self.change_every
+
+        if path == '/docs':
+            name, build = 'docs', lambda: fixtures.docs_html(revision)
+        elif path.startswith('/platform/') and path[10:] in self.platforms:
+            platform = self.platforms[path[10:]]
+            name = platform['name']
+            build = lambda: fixtures.listing_html(platform, self.keywords, revision, self.items)
+        else:
+            return None
+
+        saved = fixtures.recorded(name)
+        if saved is not None:
+            return saved.encode('utf-8'), f'"{fixtures.slug(name)}-recorded"'
+        key = (path, revision)
+        if key not in self._cache:
+            self._cache[key] = build().encode('utf-8')
+        return self._cache[key], f'"{fixtures.slug(name)}-{revision}"'
+
+    def start(self) -> str:
+        """Start serving on a free localhost port; returns the base URL."""
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                result = server.page(self.path.split('?', 1)[0])
+                if result is None:
+                    self.send_error(404)
+                    return
+                body, etag = result
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._httpd.daemon_threads = True
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
@@ -0,0 +1,730 @@
+"""
+Driver Factory
+Builds lean Chrome WebDriver instances with configurable resource blocking,
+resolves the chromedriver binary once, keeps a warm pool of sessions and
+recycles sessions that crash, hang or grow too large.
+"""
+
+import os
+import json
+import time
+import queue
+import shutil
+import logging
+import threading
+import subprocess
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = os.path.join(
+    os.environ.get('DRIVER_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'scraper-drivers')),
+    'paths.json'
+)
+BROWSER_NAMES = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser', 'chrome']
+
+# Resolved binaries, shared by all drivers started in this process
+_resolved: Dict[str, Optional[str]] = {}
+_resolve_lock = threading.Lock()
+
+# URL patterns per resource type, for Network.setBlockedURLs
+RESOURCE_PATTERNS = {
+    'image': ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico', '*.avif'],
+    'font': ['*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot'],
+    'media': ['*.mp4', '*.webm', '*.ogg', '*.mp3', '*.wav', '*.m3u8'],
+    'stylesheet': ['*.css']
+}
+
+TRACKER_PATTERNS = [
+    '*google-analytics.com*',
+    '*googletagmanager.com*',
+    '*doubleclick.net*',
+    '*googlesyndication.com*',
+    '*connect.facebook.net*',
+    '*mc.yandex.ru*',
+    '*hotjar.com*',
+    '*clarity.ms*'
+]
+
+DEFAULT_CONFIG = {
+    'headless': True,
+    'page_load_strategy': 'eager',
+    'disable_images': True,
+    'disable_extensions': True,
+    'block_resources': ['image', 'font', 'media'],
+    'block_trackers': True,
+    'block_urls': [],
+    'window_size': '1366,900',
+    'page_load_timeout': 30,
+    # Health limits: a session is recycled once it reaches any of them
+    'max_navigations': 500,
+    'max_rss_mb': 1536,
+    'max_error_rate': 0.5,
+    'health_check_every': 20,
+    # Seconds DriverPool.acquire() waits for a free session before failing
+    'acquire_timeout': 120
+}
+
+# Backoff between attempts to boot a replacement session
+RESTART_DELAY = 5
+MAX_RESTART_DELAY = 300
+
+# Number of recent operations the error rate is computed over
+ERROR_WINDOW = 20
+
+
+def merge_config(*configs: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Layer browser configurations over the defaults, later ones winning.
+
+    Args:
+        *configs: Partial configuration dictionaries, None entries are skipped
+
+    Returns:
+        Complete browser configuration
+    """
+    merged = dict(DEFAULT_CONFIG)
+    for config in configs:
+        if config:
+            merged.update(config)
+    return merged
+
+
+def blocked_url_patterns(config: Dict[str, Any]) -> List[str]:
+    """
+    Collect the URL patterns a configuration blocks.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        URL patterns for Network.setBlockedURLs
+    """
+    patterns = []
+    for resource_type in config.get('block_resources', []):
+        patterns.extend(RESOURCE_PATTERNS.get(resource_type, []))
+    if config.get('block_trackers'):
+        patterns.extend(TRACKER_PATTERNS)
+    patterns.extend(config.get('block_urls', []))
+    return patterns
+
+
+def build_options(config: Dict[str, Any]) -> Options:
+    """
+    Translate a browser configuration into Chrome options.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        Chrome options
+    """
+    options = Options()
+    if config.get('headless'):
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-first-run')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--disable-sync')
+    options.add_argument('--mute-audio')
+    if config.get('window_size'):
+        options.add_argument(f"--window-size={config['window_size']}")
+    if config.get('disable_extensions'):
+        options.add_argument('--disable-extensions')
+    if config.get('disable_images'):
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2}
+        )
+    options.page_load_strategy = config.get('page_load_strategy', 'normal')
+    return options
+
+
+def apply_blocking(driver: webdriver.Chrome, config: Dict[str, Any]) -> None:
+    """
+    Block the configured resource types and URL patterns through CDP.
+
+    Can be called again before a navigation to switch per-target rules.
+
+    Args:
+        driver: Chrome WebDriver
+        config: Browser configuration
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': blocked_url_patterns(config)})
+
+
+def _is_executable(path: Optional[str]) -> bool:
+    """Check that a path points to an executable file."""
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _load_cache() -> Dict[str, Any]:
+    """Read the on-disk binary path cache."""
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Any]) -> None:
+    """Write the on-disk binary path cache, ignoring read-only homes."""
+    try:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        with open(CACHE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Could not write driver cache: {str(e)}")
+
+
+def _validate_driver(path: str, cache: Dict[str, Any]) -> bool:
+    """
+    Check that a chromedriver binary runs, reusing a cached check if the file is unchanged.
+
+    Args:
+        path: Path to chromedriver
+        cache: Binary path cache, updated in place
+
+    Returns:
+        True if the binary is usable
+    """
+    if not _is_executable(path):
+        return False
+    mtime = os.path.getmtime(path)
+    cached = cache.get('chromedriver', {})
+    if cached.get('path') == path and cached.get('mtime') == mtime:
+        return True
+    try:
+        version = subprocess.run(
+            [path, '--version'], capture_output=True, text=True, timeout=10
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return False
+    if not version:
+        return False
+    cache['chromedriver'] = {'path': path, 'mtime': mtime, 'version': version}
+    return True
+
+
+def resolve_driver_path(config: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Find a usable chromedriver once per process.
+
+    Looks at the `driver_path` setting, the CHROMEDRIVER_PATH variable,
+    the on-disk cache and PATH before falling back to webdriver-manager,
+    so hosts without internet access start from local binaries.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        Path to chromedriver
+
+    Raises:
+        RuntimeError: If no usable chromedriver can be found
+    """
+    config = config or {}
+    with _resolve_lock:
+        if _resolved.get('chromedriver') and not config.get('driver_path'):
+            return _resolved['chromedriver']
+
+        cache = _load_cache()
+        candidates = [
+            config.get('driver_path'),
+            os.environ.get('CHROMEDRIVER_PATH'),
+            cache.get('chromedriver', {}).get('path'),
+            shutil.which('chromedriver')
+        ]
+        for candidate in candidates:
+            if candidate and _validate_driver(candidate, cache):
+                break
+        else:
+            # Only reached on a host without a local chromedriver
+            from webdriver_manager.chrome import ChromeDriverManager
+            candidate = ChromeDriverManager().install()
+            if not _validate_driver(candidate, cache):
+                raise RuntimeError(f"Downloaded chromedriver is not usable: {candidate}")
+
+        _save_cache(cache)
+        _resolved['chromedriver'] = candidate
+        return candidate
+
+
+def resolve_browser_binary(config: Optional[Dict[str, Any]] = None) -> Optional[str]:
+    """
+    Find the Chrome binary once per process.
+
+    Args:
+        config: Browser configuration
+
+    Returns:
+        Path to Chrome, or None to let chromedriver locate it
+    """
+    config = config or {}
+    if config.get('binary_location'):
+        return config['binary_location']
+    with _resolve_lock:
+        if 'browser' not in _resolved:
+            candidates = [os.environ.get('CHROME_BINARY')]
+            candidates += [shutil.which(name) for name in BROWSER_NAMES]
+            _resolved['browser'] = next(
+                (path for path in candidates if _is_executable(path)), None
+            )
+        return _resolved['browser']
+
+
+def create_driver(config: Optional[Dict[str, Any]] = None) -> webdriver.Chrome:
+    """
+    Start a Chrome WebDriver configured for scraping.
+
+    Args:
+        config: Partial browser configuration, merged over DEFAULT_CONFIG
+
+    Returns:
+        Configured Chrome WebDriver instance
+    """
+    config = merge_config(config)
+    options = build_options(config)
+    binary = resolve_browser_binary(config)
+    if binary:
+        options.binary_location = binary
+    service = Service(resolve_driver_path(config))
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(config['page_load_timeout'])
+    apply_blocking(driver, config)
+    return driver
+
+
+def reset_driver(driver: webdriver.Chrome) -> None:
+    """
+    Clear cookies, storage and cache so a session can be reused for another target.
+
+    Args:
+        driver: Chrome WebDriver
+    """
+    driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+    origin = driver.execute_script('return window.location.origin')
+    if origin and origin != 'null':
+        driver.execute_cdp_cmd(
+            'Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'}
+        )
+    driver.get('about:blank')
+
+
+def _proc_tree_rss(pid: int) -> int:
+    """Sum the RSS of a process and its descendants from /proc, in bytes."""
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    pids, total = [pid], 0
+    while pids:
+        current = pids.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'r') as f:
+                total += int(f.read().split()[1]) * page_size
+            with open(f'/proc/{current}/task/{current}/children', 'r') as f:
+                pids.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+def browser_rss_mb(driver: webdriver.Chrome) -> Optional[float]:
+    """
+    Measure the memory of a session's chromedriver and all Chrome processes under it.
+
+    Uses psutil when installed and /proc otherwise.
+
+    Args:
+        driver: Chrome WebDriver
+
+    Returns:
+        Resident set size in MiB, or None if it cannot be measured
+    """
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None:
+        return None
+    if psutil is not None:
+        try:
+            root = psutil.Process(process.pid)
+            total = 0
+            for proc in [root] + root.children(recursive=True):
+                try:
+                    total += proc.memory_info().rss
+                except psutil.Error:
+                    pass
+            return total / 2 ** 20
+        except psutil.Error:
+            return None
+    if os.path.isdir('/proc'):
+        return _proc_tree_rss(process.pid) / 2 ** 20
+    return None
+
+
+@dataclass
+class DriverHealth:
+    """Usage counters of one browser session."""
+    started: float = field(default_factory=time.monotonic)
+    navigations: int = 0
+    errors: int = 0
+    rss_mb: Optional[float] = None
+    recent: Deque[bool] = field(default_factory=lambda: deque(maxlen=ERROR_WINDOW))
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed operations among the most recent ones."""
+        if not self.recent:
+            return 0.0
+        return self.recent.count(False) / len(self.recent)
+
+
+class DriverSupervisor:
+    """
+    Tracks navigations, memory and errors per session and decides when to recycle it.
+
+    A long-lived Chrome slowly leaks memory and eventually hangs or crashes.
+    Replacing a session after `max_navigations` page loads, above
+    `max_rss_mb`, or when more than `max_error_rate` of its recent
+    operations failed keeps throughput flat over weeks of uptime.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Read the health limits.
+
+        Args:
+            config: Browser configuration; a limit of 0 or None disables it
+        """
+        self.max_navigations = config.get('max_navigations')
+        self.max_rss_mb = config.get('max_rss_mb')
+        self.max_error_rate = config.get('max_error_rate')
+        self.check_every = max(1, int(config.get('health_check_every') or 1))
+        self.health: Dict[int, DriverHealth] = {}
+        self.replaced = 0
+        self._lock = threading.Lock()
+
+    def track(self, driver: webdriver.Chrome) -> None:
+        """Start tracking a freshly started session."""
+        with self._lock:
+            self.health[id(driver)] = DriverHealth()
+
+    def forget(self, driver: webdriver.Chrome) -> None:
+        """Stop tracking a session that was quit."""
+        with self._lock:
+            self.health.pop(id(driver), None)
+
+    def record(self, driver: webdriver.Chrome, ok: bool = True) -> None:
+        """
+        Count one navigation or check done with a session.
+
+        Memory is sampled every `health_check_every` operations, since
+        walking the process tree costs a few syscalls per Chrome process.
+
+        Args:
+            driver: Chrome WebDriver
+            ok: False if the operation failed or timed out
+        """
+        with self._lock:
+            health = self.health.setdefault(id(driver), DriverHealth())
+            health.navigations += 1
+            health.recent.append(ok)
+            if not ok:
+                health.errors += 1
+            sample = self.max_rss_mb and health.navigations % self.check_every == 0
+        if sample:
+            health.rss_mb = browser_rss_mb(driver)
+
+    def recycle_reason(self, driver: webdriver.Chrome) -> Optional[str]:
+        """
+        Check a session against the health limits.
+
+        Args:
+            driver: Chrome WebDriver
+
+        Returns:
+            Why the session should be replaced, or None if it is healthy
+        """
+        health = self.health.get(id(driver))
+        if health is None:
+            return None
+        if self.max_navigations and health.navigations >= self.max_navigations:
+            return f"{health.navigations} navigations"
+        if self.max_rss_mb and health.rss_mb and health.rss_mb >= self.max_rss_mb:
+            return f"{health.rss_mb:.0f} MiB resident"
+        if (self.max_error_rate and len(health.recent) >= ERROR_WINDOW // 2
+                and health.error_rate > self.max_error_rate):
+            return f"{health.error_rate:.0%} recent errors"
+        return None
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregate health of all tracked sessions.
+
+        Returns:
+            Session count, navigations, errors, largest RSS and replaced sessions
+        """
+        with self._lock:
+            health = list(self.health.values())
+        rss = [h.rss_mb for h in health if h.rss_mb is not None]
+        return {
+            'sessions': len(health),
+            'navigations': sum(h.navigations for h in health),
+            'errors': sum(h.errors for h in health),
+            'max_rss_mb': round(max(rss), 1) if rss else None,
+            'replaced': self.replaced
+        }
+
+
+class SupervisedDriver:
+    """
+    A single long-lived session that is replaced when unhealthy or crashed.
+
+    For monitors that keep one page open; pools use DriverPool instead.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Start the session.
+
+        Args:
+            config: Browser configuration
+        """
+        self.config = merge_config(config)
+        self.supervisor = DriverSupervisor(self.config)
+        self.driver = self._start()
+
+    def _start(self) -> webdriver.Chrome:
+        """Start and track a new session."""
+        driver = create_driver(self.config)
+        self.supervisor.track(driver)
+        return driver
+
+    def record(self, ok: bool = True) -> None:
+        """
+        Count one navigation or check done with the session.
+
+        Args:
+            ok: False if the operation failed or timed out
+        """
+        self.supervisor.record(self.driver, ok)
+
+    def restart(self, url: Optional[str] = None) -> webdriver.Chrome:
+        """
+        Quit the current session and start a fresh one.
+
+        Args:
+            url: Page to reopen in the new session
+
+        Returns:
+            The new Chrome WebDriver
+        """
+        self.supervisor.forget(self.driver)
+        self.supervisor.replaced += 1
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = self._start()
+        if url:
+            self.driver.get(url)
+        return self.driver
+
+    def check(self, url: Optional[str] = None) -> Optional[str]:
+        """
+        Recycle the session if it exceeded a health limit.
+
+        Args:
+            url: Page to reopen after recycling
+
+        Returns:
+            The recycle reason, or None if the session was kept
+        """
+        reason = self.supervisor.recycle_reason(self.driver)
+        if reason:
+            logger.info(f"Recycling browser after {reason}")
+            self.restart(url)
+        return reason
+
+    def quit(self) -> None:
+        """Quit the session."""
+        self.supervisor.forget(self.driver)
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class DriverPool:
+    """
+    Thread-safe pool of pre-started browser sessions.
+
+    Sessions are reset on release and handed out again. A crashed session,
+    or one past its health limits, is replaced by a warm spare immediately,
+    while a new spare boots in the background. A session that fails to
+    boot is retried with backoff, so the pool never shrinks.
+    """
+
+    def __init__(self, size: int, config: Optional[Dict[str, Any]] = None, spares: int = 1):
+        """
+        Start all sessions up front.
+
+        Args:
+            size: Number of sessions handed out concurrently
+            config: Browser configuration for every session
+            spares: Extra sessions kept warm for crash recovery
+        """
+        self.config = merge_config(config)
+        self.size = size
+        self._idle: queue.Queue = queue.Queue()
+        self._spares: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self.drivers: List[webdriver.Chrome] = []
+        self.supervisor = DriverSupervisor(self.config)
+
+        for _ in range(size):
+            self._idle.put(self._start())
+        for _ in range(spares):
+            self._spares.put(self._start())
+
+    def _start(self) -> webdriver.Chrome:
+        """Start and register a new session."""
+        driver = create_driver(self.config)
+        with self._lock:
+            self.drivers.append(driver)
+        self.supervisor.track(driver)
+        return driver
+
+    def _replace(self, target: queue.Queue) -> None:
+        """
+        Boot a session into target, retrying with backoff until it starts
+        or the pool is closed.
+
+        Args:
+            target: Idle queue for a lost slot, spare queue for a used spare
+        """
+        delay = RESTART_DELAY
+        while not self._closed.is_set():
+            try:
+                driver = self._start()
+            except Exception as e:
+                logger.error(f"Error starting replacement browser, retrying in {delay}s: {str(e)}")
+                self._closed.wait(delay)
+                delay = min(MAX_RESTART_DELAY, delay * 2)
+                continue
+            if self._closed.is_set():
+                self._quit(driver)
+            else:
+                target.put(driver)
+            return
+
+    def _replace_in_background(self, target: queue.Queue) -> None:
+        """Run _replace on a daemon thread."""
+        threading.Thread(target=self._replace, args=(target,), daemon=True).start()
+
+    def acquire(self, timeout: Optional[float] = None) -> webdriver.Chrome:
+        """
+        Take an idle session, blocking until one is free.
+
+        Args:
+            timeout: Seconds to wait, defaults to the `acquire_timeout` setting
+
+        Returns:
+            Chrome WebDriver
+
+        Raises:
+            TimeoutError: If no session became free in time
+        """
+        if timeout is None:
+            timeout = self.config.get('acquire_timeout')
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No browser session became free within {timeout}s") from None
+
+    def record(self, driver: webdriver.Chrome, ok: bool = True) -> None:
+        """
+        Count one navigation done with a session.
+
+        Args:
+            driver: Session taken with acquire()
+            ok: False if the navigation failed or timed out
+        """
+        self.supervisor.record(driver, ok)
+
+    def release(self, driver: webdriver.Chrome, reset: bool = True) -> None:
+        """
+        Return a session to the pool, recycling it if it is unhealthy.
+
+        Args:
+            driver: Session taken with acquire()
+            reset: Clear cookies and storage before reuse
+        """
+        reason = self.supervisor.recycle_reason(driver)
+        if reason:
+            logger.info(f"Recycling browser after {reason}")
+            self.discard(driver)
+            return
+        if reset:
+            try:
+                reset_driver(driver)
+            except Exception as e:
+                logger.warning(f"Browser reset failed, replacing session: {str(e)}")
+                self.discard(driver)
+                return
+        self._idle.put(driver)
+
+    def _quit(self, driver: webdriver.Chrome) -> None:
+        """Unregister and quit a session."""
+        with self._lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        self.supervisor.forget(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def discard(self, driver: webdriver.Chrome) -> None:
+        """
+        Drop a broken session and put a fresh one in its place.
+
+        The slot is filled from the spares at once; the used spare, or the
+        slot itself when no spare is left, is rebooted in the background.
+
+        Args:
+            driver: Session taken with acquire()
+        """
+        self._quit(driver)
+        self.supervisor.replaced += 1
+        try:
+            self._idle.put(self._spares.get_nowait())
+            self._replace_in_background(self._spares)
+        except queue.Empty:
+            self._replace_in_background(self._idle)
+
+    def close(self) -> None:
+        """Quit every session owned by the pool and stop pending replacements."""
+        self._closed.set()
+        with self._lock:
+            drivers, self.drivers = self.drivers, []
+        for driver in drivers:
+            self.supervisor.forget(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,103 @@
+"""
+HTTP Fetcher
+Pooled keep-alive HTTP client for platforms that serve server-rendered listings.
+"""
+
+import logging
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'uk-UA,uk;q=0.9,en;q=0.6',
+    'Accept-Encoding': 'gzip, deflate'
+}
+
+
+class FetchResult(NamedTuple):
+    """Outcome of a page download."""
+    status: int
+    text: Optional[str]
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class HttpFetcher:
+    """Shared aiohttp session with a tuned connection pool."""
+
+    def __init__(self, timeout: float = 30, limit_per_host: int = 2):
+        """
+        Store pool settings; the session is opened by start().
+
+        Args:
+            timeout: Total request timeout in seconds
+            limit_per_host: Maximum parallel connections per host
+        """
+        self.timeout = timeout
+        self.limit_per_host = limit_per_host
+        self.session: Optional[aiohttp.ClientSession] = None
+        # ETag and Last-Modified of the last successful response per URL
+        self.validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    async def start(self) -> None:
+        """Open the session; must be called from the running event loop."""
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers=DEFAULT_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def fetch(self, url: str) -> FetchResult:
+        """
+        Download a page, revalidating against the previous response.
+
+        Sends If-None-Match / If-Modified-Since when the URL was fetched
+        before, so an unchanged page costs a bodiless 304 response.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            FetchResult with the decoded body on 200, no body otherwise
+        """
+        headers = {}
+        etag, last_modified = self.validators.get(url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+
+        async with self.session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                return FetchResult(resp.status, None)
+            if resp.status != 200:
+                logger.warning(f"HTTP {resp.status} for {url}")
+                return FetchResult(resp.status, None)
+
+            text = await resp.text(errors='replace')
+            self.validators[url] = (
+                resp.headers.get('ETag'),
+                resp.headers.get('Last-Modified')
+            )
+            return FetchResult(resp.status, text)
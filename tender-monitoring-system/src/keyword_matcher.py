@@ -0,0 +1,258 @@
+"""
+Keyword Matcher
+Single-pass keyword matchers for tender page text: an exact Aho-Corasick
+automaton and a morphology-aware matcher over stemmed tokens.
+"""
+
+import json
+from collections import deque
+from typing import Dict, List, NamedTuple, Tuple
+
+from morphology import tokenize
+
+
+class KeywordMatch(NamedTuple):
+    """A single keyword occurrence in the scanned text."""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+class BaseMatcher:
+    """Common interface of the keyword matchers."""
+
+    patterns: List[Tuple[str, str, int]]
+
+    @classmethod
+    def from_file(cls, path: str) -> 'BaseMatcher':
+        """
+        Load keywords from a JSON file and compile the matcher.
+
+        Args:
+            path: Path to keywords JSON file
+
+        Returns:
+            Compiled matcher
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matches ordered by end position
+        """
+        raise NotImplementedError
+
+    def match_keywords(self, text: str) -> Dict[str, KeywordMatch]:
+        """
+        Find the first occurrence of each distinct keyword.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Mapping of keyword to its first match, in order of appearance
+        """
+        first = {}
+        for match in self.find_all(text):
+            if match.keyword not in first:
+                first[match.keyword] = match
+        return first
+
+
+class KeywordMatcher(BaseMatcher):
+    """Exact multi-pattern matcher compiled once from the keyword configuration."""
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """
+        Build the automaton for all keywords.
+
+        Args:
+            keywords: Mapping of category name to list of keywords
+        """
+        # Each state is a dict of transitions; outputs hold indexes into
+        # self.patterns (keyword, category, length) for every keyword
+        # that ends in that state.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[List[int]] = [[]]
+        self.patterns: List[Tuple[str, str, int]] = []
+
+        seen = set()
+        for category, terms in keywords.items():
+            for term in terms:
+                normalized = self.normalize(term.strip())
+                if not normalized or normalized in seen:
+                    continue
+                seen.add(normalized)
+                self._add_pattern(normalized, term, category)
+
+        self._build_failure_links()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize text for matching without changing its length.
+
+        Args:
+            text: Raw text
+
+        Returns:
+            Lowercased text with non-breaking spaces replaced
+        """
+        return text.lower().replace('\xa0', ' ')
+
+    def _add_pattern(self, normalized: str, keyword: str, category: str) -> None:
+        """Insert a normalized keyword into the trie."""
+        state = 0
+        for char in normalized:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append([])
+            state = next_state
+
+        self._outputs[state].append(len(self.patterns))
+        self.patterns.append((keyword, category, len(normalized)))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge suffix outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._outputs[next_state].extend(self._outputs[self._fail[next_state]])
+
+    def find_all(self, text: str, normalized: bool = False) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in the text.
+
+        Args:
+            text: Text to scan
+            normalized: True if text was already passed through normalize()
+
+        Returns:
+            Matches ordered by end position
+        """
+        if not normalized:
+            text = self.normalize(text)
+
+        goto, fail, outputs, patterns = self._goto, self._fail, self._outputs, self.patterns
+        matches = []
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in outputs[state]:
+                keyword, category, length = patterns[index]
+                end = position + 1
+                matches.append(KeywordMatch(keyword, category, end - length, end))
+        return matches
+
+
+class StemMatcher(BaseMatcher):
+    """
+    Morphology-aware matcher over stemmed tokens.
+
+    Keywords and page text are both stemmed, so one canonical keyword covers
+    all of its inflections, and multi-word keywords match in any word order.
+    """
+
+    # Extra tokens allowed inside a multi-word match ("ваги автомобільні
+    # електронні" still matches "автомобільні ваги")
+    MAX_GAP = 1
+
+    def __init__(self, keywords: Dict[str, List[str]]):
+        """
+        Build the token index for all keywords.
+
+        Args:
+            keywords: Mapping of category name to list of keywords
+        """
+        # self.patterns holds (keyword, category, word count); the index maps
+        # the anchor stem of each keyword to the keywords it can start.
+        self.patterns: List[Tuple[str, str, int]] = []
+        self._stems: List[frozenset] = []
+        self._index: Dict[str, List[int]] = {}
+
+        seen = set()
+        for category, terms in keywords.items():
+            for term in terms:
+                stems = frozenset(token.stem for token in tokenize(term))
+                if not stems or stems in seen:
+                    continue
+                seen.add(stems)
+                self._index.setdefault(min(stems), []).append(len(self.patterns))
+                self._stems.append(stems)
+                self.patterns.append((term.strip(), category, len(stems)))
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in the text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Matches ordered by position of their anchor word
+        """
+        tokens = tokenize(text)
+        matches = []
+        for position, token in enumerate(tokens):
+            for index in self._index.get(token.stem, ()):
+                keyword, category, size = self.patterns[index]
+                if size == 1:
+                    matches.append(KeywordMatch(keyword, category, token.start, token.end))
+                    continue
+
+                span = self._find_span(tokens, position, self._stems[index], size + self.MAX_GAP)
+                if span:
+                    first, last = span
+                    matches.append(KeywordMatch(
+                        keyword, category, tokens[first].start, tokens[last].end
+                    ))
+        return matches
+
+    @staticmethod
+    def _find_span(tokens: List, position: int, stems: frozenset, width: int):
+        """
+        Find a window of at most `width` tokens around `position` holding all stems.
+
+        Args:
+            tokens: Stemmed page tokens
+            position: Index of the anchor token
+            stems: Stems of the keyword
+            width: Maximum window size in tokens
+
+        Returns:
+            (first, last) token indexes of the match, or None
+        """
+        for start in range(max(0, position - width + 1), position + 1):
+            window = tokens[start:start + width]
+            found = {}
+            for offset, token in enumerate(window):
+                if token.stem in stems and token.stem not in found:
+                    found[token.stem] = start + offset
+            if len(found) == len(stems):
+                return min(found.values()), max(found.values())
+        return None
@@ -0,0 +1,111 @@
+"""
+Listing Parser
+Extracts individual tender items from a platform listing page.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+@dataclass
+class TenderItem:
+    """A single tender on a listing page."""
+    id: str
+    title: str
+    description: str
+    link: str
+
+    @property
+    def text(self) -> str:
+        """Text used for keyword matching."""
+        return f"{self.title}\n{self.description}"
+
+
+def _select_text(element, selector: Optional[str]) -> str:
+    """Return the stripped text of the first match of selector inside element."""
+    if not selector:
+        return ''
+    found = element.select_one(selector)
+    return found.get_text(' ', strip=True) if found else ''
+
+
+def _item_link(element, platform: Dict[str, str]) -> str:
+    """Resolve the absolute link of a tender item, falling back to the listing URL."""
+    link_selector = platform.get('link_selector', 'a[href]')
+    anchor = element if element.name == 'a' and element.get('href') else element.select_one(link_selector)
+    if anchor and anchor.get('href'):
+        return urljoin(platform['url'], anchor['href'])
+    return platform['url']
+
+
+def _item_id(element, platform: Dict[str, str], title: str, link: str) -> str:
+    """
+    Derive a stable identifier for a tender item.
+
+    Prefers the configured id attribute, then the item link, then a hash of the title.
+    """
+    id_attribute = platform.get('id_attribute')
+    if id_attribute and element.get(id_attribute):
+        return str(element[id_attribute])
+    if link != platform['url']:
+        return link
+    return hashlib.sha1(title.encode('utf-8')).hexdigest()
+
+
+def listing_hash(items: List[TenderItem]) -> str:
+    """
+    Hash the extracted content of a listing.
+
+    Args:
+        items: Tender items of the listing
+
+    Returns:
+        Hex digest that changes whenever any item changes
+    """
+    digest = hashlib.sha1()
+    for item in items:
+        for field in (item.id, item.title, item.description, item.link):
+            digest.update(field.encode('utf-8'))
+            digest.update(b'\x1f')
+    return digest.hexdigest()
+
+
+def parse_listing(html: str, platform: Dict[str, str]) -> List[TenderItem]:
+    """
+    Parse every tender item of a listing page in one pass.
+
+    Args:
+        html: Page source of the listing
+        platform: Platform configuration dictionary
+
+    Returns:
+        Tender items in page order
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    items = []
+    for element in soup.select(platform['selector']):
+        title = _select_text(element, platform.get('title_selector'))
+        description = _select_text(element, platform.get('description_selector'))
+        if not title and not description:
+            description = element.get_text(' ', strip=True)
+        if not title and not description:
+            continue
+
+        link = _item_link(element, platform)
+        items.append(TenderItem(
+            id=_item_id(element, platform, title or description, link),
+            title=title,
+            description=description,
+            link=link
+        ))
+    return items
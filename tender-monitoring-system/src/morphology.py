@@ -0,0 +1,73 @@
+"""
+Morphology
+Light suffix-stripping stemmer and tokenizer for Ukrainian tender texts.
+"""
+
+import re
+from functools import lru_cache
+from typing import List, NamedTuple
+
+# Words, optionally joined by an apostrophe ("п'ять", "об’єкт")
+TOKEN_PATTERN = re.compile(r"[^\W_]+(?:['’ʼ][^\W_]+)*")
+APOSTROPHES = str.maketrans('', '', "'’ʼ")
+CYRILLIC = re.compile(r'[а-яіїєґ]')
+
+# Inflectional endings of nouns, adjectives and participles, including
+# the adjective-forming "-ов-" suffix so that "дробарка" and "дробаркове"
+# share a stem. Longest endings are tried first.
+ENDINGS = sorted({
+    'ового', 'овому', 'овими', 'овій', 'овий', 'ових', 'овим', 'ова', 'ове',
+    'ові', 'ову', 'овою', 'ової',
+    'ого', 'ому', 'ими', 'ій', 'ий', 'их', 'им', 'ої', 'ою', 'ею', 'єю',
+    'ами', 'ями', 'ах', 'ях', 'ам', 'ям', 'ів', 'їв', 'ом', 'ем', 'єм',
+    'еві', 'єві',
+    'а', 'я', 'е', 'є', 'и', 'і', 'ї', 'у', 'ю', 'о', 'ь', 'й',
+}, key=len, reverse=True)
+
+MIN_STEM_LENGTH = 3
+
+
+class Token(NamedTuple):
+    """A stemmed word and its span in the source text."""
+    stem: str
+    start: int
+    end: int
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    """
+    Reduce a word to its stem by stripping the longest inflectional ending.
+
+    Non-Cyrillic words (codes, Latin brand names) are only lowercased.
+
+    Args:
+        word: Single word
+
+    Returns:
+        Stem of the word
+    """
+    word = word.lower().translate(APOSTROPHES)
+    if not CYRILLIC.search(word):
+        return word
+
+    for ending in ENDINGS:
+        if word.endswith(ending) and len(word) - len(ending) >= MIN_STEM_LENGTH:
+            return word[:-len(ending)]
+    return word
+
+
+def tokenize(text: str) -> List[Token]:
+    """
+    Split text into stemmed tokens.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        Tokens in order of appearance
+    """
+    return [
+        Token(stem(match.group()), match.start(), match.end())
+        for match in TOKEN_PATTERN.finditer(text)
+    ]
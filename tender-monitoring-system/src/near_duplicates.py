@@ -0,0 +1,176 @@
+"""
+Near-Duplicate Index
+MinHash signatures with LSH banding to spot the same tender reposted with slightly different text.
+"""
+
+import time
+import random
+import hashlib
+from array import array
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, Iterable, Optional, Set, Tuple
+
+from morphology import tokenize
+
+NUM_PERMUTATIONS = 64
+BANDS = 16
+ROWS = NUM_PERMUTATIONS // BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures are persisted, so permutations must not change between runs
+_random = random.Random(0x7E4D)
+PERMUTATIONS = [
+    (_random.randrange(1, MERSENNE_PRIME), _random.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+Signature = Tuple[int, ...]
+
+
+def _token_hash(token: str) -> int:
+    """Hash a token to a 32-bit integer."""
+    return int.from_bytes(
+        hashlib.blake2b(token.encode('utf-8'), digest_size=4).digest(), 'big'
+    )
+
+
+@lru_cache(maxsize=1 << 14)
+def _token_signature(token: str) -> array:
+    """
+    All permuted hashes of one token.
+
+    Tender texts share most of their vocabulary, so caching these turns a
+    signature into a column-wise minimum over cached rows. Rows are packed
+    32-bit arrays, under 500 bytes each, so a full cache stays below 8 MB.
+    """
+    value = _token_hash(token)
+    return array('I', [(a * value + b) % MERSENNE_PRIME & MAX_HASH for a, b in PERMUTATIONS])
+
+
+def minhash(text: str) -> Signature:
+    """
+    Compute the MinHash signature of a text.
+
+    The text is reduced to its set of stemmed words, skipping one- and
+    two-letter words such as conjunctions and prepositions, so inflection
+    and word order do not affect the signature.
+
+    Args:
+        text: Text to fingerprint
+
+    Returns:
+        Signature of NUM_PERMUTATIONS values
+    """
+    stems = {
+        token.stem
+        for token in tokenize(text)
+        if len(token.stem) > 2 or not token.stem.isalpha()
+    }
+    if not stems:
+        return (MAX_HASH,) * NUM_PERMUTATIONS
+
+    # One pass over the tokens; min() runs over each permutation's column in C
+    return tuple(map(min, zip(*map(_token_signature, stems))))
+
+
+def signature_to_bytes(signature: Signature) -> bytes:
+    """Serialize a signature for storage."""
+    return array('I', signature).tobytes()
+
+
+def signature_from_bytes(data: bytes) -> Signature:
+    """Deserialize a stored signature."""
+    values = array('I')
+    values.frombytes(data)
+    return tuple(values)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimate the Jaccard similarity of two texts from their signatures."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERMUTATIONS
+
+
+class NearDuplicateIndex:
+    """
+    Recent MinHash signatures indexed by LSH bands.
+
+    Texts sharing any band of ROWS values become candidates, and only
+    candidates are compared against the similarity threshold, so a lookup
+    touches a handful of entries regardless of index size.
+    """
+
+    def __init__(self, threshold: float, ttl: float, max_entries: int = 100000):
+        """
+        Create an empty index.
+
+        Args:
+            threshold: Estimated Jaccard similarity above which texts are duplicates
+            ttl: Seconds an entry is kept
+            max_entries: Upper bound on the number of indexed entries
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._entries: Deque[Tuple[float, str, Signature]] = deque()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], Set[Tuple[str, Signature]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _band_keys(signature: Signature) -> Iterable[Tuple[int, Tuple[int, ...]]]:
+        """Split a signature into (band index, band values) bucket keys."""
+        for band in range(BANDS):
+            yield band, signature[band * ROWS:(band + 1) * ROWS]
+
+    def find(self, signature: Signature) -> Optional[str]:
+        """
+        Find an indexed entry similar to the signature.
+
+        Args:
+            signature: MinHash signature of the new text
+
+        Returns:
+            Key of the near duplicate or None
+        """
+        checked = set()
+        for band_key in self._band_keys(signature):
+            for key, candidate in self._buckets.get(band_key, ()):
+                if key in checked:
+                    continue
+                checked.add(key)
+                if similarity(signature, candidate) >= self.threshold:
+                    return key
+        return None
+
+    def add(self, key: str, signature: Signature, added_at: Optional[float] = None) -> None:
+        """
+        Index a signature.
+
+        Args:
+            key: Identifier reported by find()
+            signature: MinHash signature
+            added_at: Unix timestamp, defaults to now
+        """
+        added_at = time.time() if added_at is None else added_at
+        self._entries.append((added_at, key, signature))
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, set()).add((key, signature))
+        self.evict_expired()
+
+    def evict_expired(self) -> None:
+        """Drop entries older than the TTL or beyond the size limit."""
+        cutoff = time.time() - self.ttl
+        while self._entries and (
+            self._entries[0][0] < cutoff or len(self._entries) > self.max_entries
+        ):
+            _, key, signature = self._entries.popleft()
+            for band_key in self._band_keys(signature):
+                bucket = self._buckets.get(band_key)
+                if bucket is not None:
+                    bucket.discard((key, signature))
+                    if not bucket:
+                        del self._buckets[band_key]
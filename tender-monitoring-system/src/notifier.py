@@ -0,0 +1,313 @@
+"""
+Telegram Notifier
+Persistent, rate-limited outbound queue that coalesces tender alerts into digest messages.
+"""
+
+import time
+import asyncio
+import sqlite3
+import logging
+from typing import List, Optional, Tuple
+
+from telegram import Bot
+from telegram.error import BadRequest, RetryAfter
+
+from scheduler import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+MAX_MESSAGE_LENGTH = 4096
+DIGEST_SEPARATOR = '\n\n〰〰〰〰〰\n\n'
+
+
+class RateLimited(Exception):
+    """Telegram asked to wait; the alerts involved are already postponed."""
+
+    def __init__(self, delay: float):
+        super().__init__(f"Rate limited for {delay:.0f}s")
+        self.delay = delay
+
+
+class TelegramNotifier:
+    """
+    Queues alerts in SQLite and sends them from a background task.
+
+    Alerts queued within `digest_delay` seconds are packed into as few
+    messages as fit Telegram's 4096 character limit. Failed sends stay in
+    the queue and are retried with backoff, including after a restart.
+    When a digest fails its alerts are retried one by one, so a single bad
+    alert cannot hold back the others; alerts Telegram rejects as invalid,
+    or that failed `max_attempts` times, are moved to a dead-letter table.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        chat_id: str,
+        path: str,
+        messages_per_minute: float = 20,
+        digest_delay: float = 5,
+        max_attempts: int = 8
+    ):
+        """
+        Open the persistent queue.
+
+        Args:
+            bot: Telegram bot used for sending
+            chat_id: Target chat
+            path: Path to the SQLite database file
+            messages_per_minute: Send rate limit for the chat
+            digest_delay: Seconds to wait for more alerts before sending
+            max_attempts: Failed sends before an alert is dead-lettered
+        """
+        self.bot = bot
+        self.chat_id = chat_id
+        self.digest_delay = digest_delay
+        self.max_attempts = max_attempts
+        self.rate_limit = TokenBucket(messages_per_minute)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, next_attempt REAL NOT NULL DEFAULT 0)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS dead_letters ("
+            "id INTEGER PRIMARY KEY, text TEXT NOT NULL, attempts INTEGER NOT NULL, "
+            "error TEXT, failed_at REAL NOT NULL)"
+        )
+        self.connection.commit()
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def pending(self) -> int:
+        """Number of queued alerts."""
+        return self.connection.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def enqueue(self, text: str) -> None:
+        """
+        Queue an alert for sending.
+
+        Args:
+            text: HTML formatted alert; the caller keeps it within
+                MAX_MESSAGE_LENGTH, since cutting HTML can break its markup
+
+        Raises:
+            ValueError: If the alert is longer than one Telegram message
+        """
+        if len(text) > MAX_MESSAGE_LENGTH:
+            raise ValueError(f"Alert is {len(text)} characters, the limit is {MAX_MESSAGE_LENGTH}")
+        self.connection.execute("INSERT INTO outbox (text) VALUES (?)", (text,))
+        self.connection.commit()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def start(self) -> None:
+        """Start the sender task; must be called from the running event loop."""
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        if self.pending():
+            logger.info(f"Resuming {self.pending()} queued notifications")
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Stop the sender task; unsent alerts stay queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.connection.close()
+
+    def _next_digest(self) -> List[Tuple[int, str]]:
+        """
+        Pack the oldest due alerts into one message.
+
+        Returns:
+            Row ids and texts of the alerts in the digest
+        """
+        rows = self.connection.execute(
+            "SELECT id, text FROM outbox WHERE next_attempt <= ? ORDER BY id",
+            (time.time(),)
+        )
+        batch, length = [], 0
+        for row_id, text in rows:
+            added = len(text) + (len(DIGEST_SEPARATOR) if batch else 0)
+            if batch and length + added > MAX_MESSAGE_LENGTH:
+                break
+            batch.append((row_id, text))
+            length += added
+        return batch
+
+    def _retry_delay(self) -> Optional[float]:
+        """Seconds until the earliest postponed alert is due, if any."""
+        row = self.connection.execute("SELECT MIN(next_attempt) FROM outbox").fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    async def _send(self, text: str) -> None:
+        """Send one message, waiting for the rate limiter first."""
+        while not self.rate_limit.try_acquire(time.monotonic()):
+            await asyncio.sleep(self.rate_limit.wait_time(time.monotonic()))
+        await self.bot.send_message(
+            chat_id=self.chat_id,
+            text=text,
+            parse_mode='HTML'
+        )
+
+    async def _run(self) -> None:
+        """Sender loop: wait for alerts, coalesce them and send digests."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._retry_delay())
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            # Give alerts from the same check a moment to arrive
+            await asyncio.sleep(self.digest_delay)
+
+            while True:
+                batch = self._next_digest()
+                if not batch:
+                    break
+                try:
+                    if len(batch) == 1:
+                        sent = await self._deliver(batch)
+                    else:
+                        sent = await self._deliver(batch, quiet=True)
+                        if not sent:
+                            sent = await self._deliver_each(batch)
+                except RateLimited as e:
+                    # The whole chat is throttled, so no alert is retried early
+                    logger.warning(f"Telegram rate limit, pausing notifications for {e.delay:.0f}s")
+                    break
+                if not sent:
+                    break
+
+    async def _deliver(self, batch: List[Tuple[int, str]], quiet: bool = False) -> bool:
+        """
+        Send alerts as one message and update the queue.
+
+        Args:
+            batch: Row ids and texts of the alerts
+            quiet: Leave the queue unchanged on errors other than RetryAfter,
+                so the caller can retry the alerts one by one
+
+        Returns:
+            True if sending may continue with the next alerts
+
+        Raises:
+            RateLimited: If Telegram answered with RetryAfter; the alerts
+                are postponed by the requested delay without counting an attempt
+        """
+        ids = [row_id for row_id, _ in batch]
+        try:
+            await self._send(DIGEST_SEPARATOR.join(text for _, text in batch))
+        except RetryAfter as e:
+            retry_after = e.retry_after
+            if hasattr(retry_after, 'total_seconds'):
+                retry_after = retry_after.total_seconds()
+            self._postpone(ids, float(retry_after))
+            raise RateLimited(float(retry_after)) from e
+        except Exception as e:
+            if quiet:
+                logger.warning(f"Digest of {len(batch)} alerts failed, sending them one by one: {str(e)}")
+                return False
+            logger.error(f"Error sending Telegram message: {str(e)}")
+            if isinstance(e, BadRequest):
+                # Telegram rejected the message itself; retrying cannot help
+                self._dead_letter(ids, str(e))
+                return True
+            self._postpone(ids, error=str(e))
+            return False
+        self.connection.execute(
+            f"DELETE FROM outbox WHERE id IN ({','.join('?' * len(ids))})", ids
+        )
+        self.connection.commit()
+        return True
+
+    async def _deliver_each(self, batch: List[Tuple[int, str]]) -> bool:
+        """
+        Send the alerts of a failed digest individually.
+
+        Returns:
+            True if all alerts were sent or dead-lettered
+
+        Raises:
+            RateLimited: If Telegram answered with RetryAfter; the unsent
+                alerts are postponed by the requested delay
+        """
+        for index, alert in enumerate(batch):
+            rest = [row_id for row_id, _ in batch[index + 1:]]
+            try:
+                sent = await self._deliver([alert])
+            except RateLimited as e:
+                if rest:
+                    self._postpone(rest, e.delay)
+                raise
+            if not sent:
+                # Transient failure: the rest of the digest waits with it
+                if rest:
+                    self._postpone(rest)
+                return False
+        return True
+
+    def _postpone(self, ids: List[int], delay: Optional[float] = None, error: Optional[str] = None) -> None:
+        """
+        Reschedule failed alerts with exponential backoff.
+
+        Alerts that have now failed `max_attempts` times are dead-lettered
+        instead. A RetryAfter delay is not counted as an attempt.
+
+        Args:
+            ids: Row ids of the failed alerts
+            delay: Delay requested by Telegram, overrides the backoff
+            error: Error message kept with dead-lettered alerts
+        """
+        placeholders = ','.join('?' * len(ids))
+        if delay is None:
+            self.connection.execute(
+                f"UPDATE outbox SET attempts = attempts + 1 WHERE id IN ({placeholders})", ids
+            )
+            exhausted = [row[0] for row in self.connection.execute(
+                f"SELECT id FROM outbox WHERE id IN ({placeholders}) AND attempts >= ?",
+                ids + [self.max_attempts]
+            )]
+            if exhausted:
+                self._dead_letter(exhausted, error or 'too many failed attempts')
+                ids = [row_id for row_id in ids if row_id not in exhausted]
+                if not ids:
+                    return
+                placeholders = ','.join('?' * len(ids))
+            attempts = self.connection.execute(
+                f"SELECT MAX(attempts) FROM outbox WHERE id IN ({placeholders})", ids
+            ).fetchone()[0]
+            delay = min(600, 5 * 2 ** (attempts - 1))
+        self.connection.execute(
+            f"UPDATE outbox SET next_attempt = ? WHERE id IN ({placeholders})",
+            [time.time() + delay] + ids
+        )
+        self.connection.commit()
+
+    def _dead_letter(self, ids: List[int], error: str) -> None:
+        """
+        Move alerts that cannot be sent out of the queue.
+
+        Args:
+            ids: Row ids of the alerts
+            error: Reason kept with the alerts
+        """
+        placeholders = ','.join('?' * len(ids))
+        self.connection.execute(
+            "INSERT OR REPLACE INTO dead_letters (id, text, attempts, error, failed_at) "
+            f"SELECT id, text, attempts, ?, ? FROM outbox WHERE id IN ({placeholders})",
+            [error, time.time()] + ids
+        )
+        self.connection.execute(f"DELETE FROM outbox WHERE id IN ({placeholders})", ids)
+        self.connection.commit()
+        logger.error(f"Dropped {len(ids)} undeliverable notifications to dead_letters: {error}")
@@ -0,0 +1,183 @@
+"""
+Polling Scheduler
+Per-platform adaptive polling intervals with error backoff and per-host request budgets.
+"""
+
+import time
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
+from urllib.parse import urlparse
+
+
+@dataclass
+class PlatformSchedule:
+    """Polling state of a single platform."""
+    platform: Dict[str, Any]
+    host: str
+    interval: float
+    min_interval: float
+    max_interval: float
+    next_run: float = 0.0
+    failures: int = 0
+
+
+class TokenBucket:
+    """Token bucket limiting a request rate, e.g. requests per minute to one host."""
+
+    def __init__(self, requests_per_minute: float):
+        """
+        Create a full bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate and burst size
+        """
+        self.capacity = max(1.0, requests_per_minute)
+        self.rate = self.capacity / 60
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float) -> bool:
+        """
+        Take a token if one is available.
+
+        Args:
+            now: Current monotonic time
+
+        Returns:
+            True if the request may be made now
+        """
+        self._refill(now)
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until the next token becomes available."""
+        self._refill(now)
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class PollingScheduler:
+    """
+    Decides when each platform is checked next.
+
+    Platforms whose listing changed are polled faster, quiet ones slower,
+    within their min/max interval. Failed checks are retried with
+    exponential backoff and jitter, starting at `retry_delay`; after
+    `max_retries` consecutive failures the platform drops to `max_interval`.
+    """
+
+    def __init__(self, platforms: Iterable[Dict[str, Any]], settings: Dict[str, Any]):
+        """
+        Build schedules for all platforms.
+
+        Args:
+            platforms: Platform configuration dictionaries
+            settings: Global settings from platforms.json
+        """
+        self.max_retries = settings.get('max_retries', 3)
+        self.retry_delay = settings.get('retry_delay', 5)
+        self.speedup = settings.get('interval_speedup', 0.5)
+        self.slowdown = settings.get('interval_slowdown', 1.5)
+
+        budget = settings.get('host_requests_per_minute', 6)
+        self.budgets: Dict[str, TokenBucket] = {}
+        self.schedules: Dict[str, PlatformSchedule] = {}
+
+        now = time.monotonic()
+        for index, platform in enumerate(platforms):
+            interval = platform.get('check_interval', settings['check_interval'])
+            host = urlparse(platform['url']).netloc
+            self.budgets.setdefault(host, TokenBucket(budget))
+            self.schedules[platform['name']] = PlatformSchedule(
+                platform=platform,
+                host=host,
+                interval=interval,
+                min_interval=platform.get('min_interval', settings.get('min_interval', interval)),
+                max_interval=platform.get('max_interval', settings.get('max_interval', interval)),
+                # Spread the first checks slightly instead of starting all at once
+                next_run=now + index * 0.5
+            )
+
+    def due(self, running: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """
+        Collect platforms that should be checked now.
+
+        Platforms over their host budget are postponed until a token frees up.
+
+        Args:
+            running: Names of platforms with a check still in progress
+
+        Returns:
+            Platform configuration dictionaries to check
+        """
+        now = time.monotonic()
+        running = set(running)
+        ready = []
+        for name, schedule in self.schedules.items():
+            if name in running or schedule.next_run > now:
+                continue
+            budget = self.budgets[schedule.host]
+            if budget.try_acquire(now):
+                ready.append(schedule.platform)
+            else:
+                schedule.next_run = now + budget.wait_time(now)
+        return ready
+
+    def next_due_in(self, running: Iterable[str] = ()) -> float:
+        """
+        Seconds until the next idle platform becomes due.
+
+        Args:
+            running: Names of platforms with a check still in progress
+
+        Returns:
+            Delay in seconds, 0 if a platform is already due
+        """
+        running = set(running)
+        pending = [
+            schedule.next_run
+            for name, schedule in self.schedules.items()
+            if name not in running
+        ]
+        if not pending:
+            return max(schedule.min_interval for schedule in self.schedules.values())
+        return max(0.0, min(pending) - time.monotonic())
+
+    def record(self, name: str, outcome: str) -> float:
+        """
+        Update a platform's schedule after a check.
+
+        Args:
+            name: Platform name
+            outcome: 'checked' (listing changed), 'unchanged' or 'failed'
+
+        Returns:
+            Delay in seconds until the platform's next check
+        """
+        schedule = self.schedules[name]
+        if outcome == 'failed':
+            schedule.failures += 1
+            if schedule.failures <= self.max_retries:
+                backoff = self.retry_delay * 2 ** (schedule.failures - 1)
+                delay = min(backoff, schedule.max_interval)
+            else:
+                delay = schedule.max_interval
+            delay *= random.uniform(0.8, 1.2)
+        else:
+            schedule.failures = 0
+            factor = self.speedup if outcome == 'checked' else self.slowdown
+            schedule.interval = min(
+                schedule.max_interval,
+                max(schedule.min_interval, schedule.interval * factor)
+            )
+            delay = schedule.interval * random.uniform(0.9, 1.1)
+
+        schedule.next_run = time.monotonic() + delay
+        return delay
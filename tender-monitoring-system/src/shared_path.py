@@ -0,0 +1,13 @@
+"""
+Shared Path
+Makes the repository's shared modules (shared/) importable from this project.
+"""
+
+import os
+import sys
+
+SHARED_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'shared')
+)
+if SHARED_DIR not in sys.path:
+    sys.path.insert(0, SHARED_DIR)
@@ -5,25 +5,45 @@ Monitors multiple tender platforms for specific keywords and sends notifications
 """
 
 import os
+import html
 import json
+import time
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from collections import Counter
 from typing import Dict, List, Optional, Any
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from telegram import Bot
 from dotenv import load_dotenv
 
+import shared_path  # noqa: F401 - adds shared/ to sys.path
+from driver_factory import DriverPool, apply_blocking, merge_config
+from keyword_matcher import KeywordMatch, KeywordMatcher, StemMatcher
+from listing import TenderItem, listing_hash, parse_listing
+from http_fetcher import HttpFetcher
+from scheduler import PollingScheduler
+from notifier import MAX_MESSAGE_LENGTH, TelegramNotifier
+from tender_store import SeenTenderStore, tender_fingerprint
+from near_duplicates import (
+    NearDuplicateIndex,
+    minhash,
+    signature_from_bytes,
+    signature_to_bytes
+)
+
+class ListingNotModified(Exception):
+    """Raised when the server reports an unchanged listing (HTTP 304)."""
+
+
+class ListingUnavailable(Exception):
+    """Raised when the server answers with an error status instead of the listing."""
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,9 +55,9 @@ class TenderMonitor:
     def __init__(self):
         """Initialize the tender monitoring system."""
         self._load_config()
-        self._setup_driver()
+        self._setup_drivers()
+        self._setup_store()
         self._setup_telegram()
-        self.last_messages = {}
 
     def _load_config(self) -> None:
         """Load configuration from files and environment."""
@@ -50,193 +70,409 @@ class TenderMonitor:
         if not self.telegram_token or not self.telegram_chat_id:
             raise ValueError("Telegram configuration missing")
         
-        # Load keywords
-        with open('config/keywords.json', 'r', encoding='utf-8') as f:
-            self.keywords = []
-            keywords_data = json.load(f)
-            for category in keywords_data.values():
-                self.keywords.extend(category)
-        
         # Load platform configurations
         with open('config/platforms.json', 'r', encoding='utf-8') as f:
             config = json.load(f)
             self.platforms = config['platforms']
             self.settings = config['settings']
-
-    def _setup_driver(self) -> None:
-        """Configure and initialize Selenium WebDriver."""
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
+        self.state_path = self.settings.get('state_path', 'data/tender_state.db')
         
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
-        self.wait = WebDriverWait(self.driver, 10)
+        # Compile keywords into a single-pass matcher
+        matching = self.settings.get('keyword_matching', 'stem')
+        matcher_class = StemMatcher if matching == 'stem' else KeywordMatcher
+        self.matcher = matcher_class.from_file('config/keywords.json')
+        logger.info(f"Loaded {len(self.matcher)} keywords ({matching} matching)")
+
+    def _setup_drivers(self) -> None:
+        """Start the warm pool of browser workers used to check platforms."""
+        self.browser_config = merge_config(
+            {'page_load_timeout': self.settings.get('page_load_timeout', 30)},
+            self.settings.get('browser')
+        )
+        self.worker_count = max(1, int(self.settings.get('workers', 1)))
+        self.driver_pool = DriverPool(
+            self.worker_count,
+            self.browser_config,
+            spares=self.settings.get('spare_workers', 1)
+        )
+        # Selenium calls are blocking, so every driver call runs on this
+        # executor instead of the event loop thread. One thread per pooled
+        # browser means acquiring a driver never waits.
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.worker_count,
+            thread_name_prefix='browser-worker'
+        )
+        # Content hash of the last extracted listing per platform
+        self.listing_hashes: Dict[str, str] = {}
+        self.scheduler = PollingScheduler(self.platforms, self.settings)
+        self.stats: Counter = Counter()
+        self.http = HttpFetcher(
+            timeout=self.settings.get('page_load_timeout', 30),
+            limit_per_host=self.settings.get('http_connections_per_host', 2)
+        )
 
     def _setup_telegram(self) -> None:
-        """Initialize Telegram bot."""
+        """Initialize Telegram bot and the outbound notification queue."""
         self.bot = Bot(token=self.telegram_token)
+        self.notifier = TelegramNotifier(
+            self.bot,
+            self.telegram_chat_id,
+            self.state_path,
+            messages_per_minute=self.settings.get('telegram_messages_per_minute', 20),
+            digest_delay=self.settings.get('digest_delay', 5)
+        )
+
+    def _setup_store(self) -> None:
+        """Open the persistent store of already notified tenders."""
+        self.seen_tenders = SeenTenderStore(
+            self.state_path,
+            self.settings['message_expiration']
+        )
+        logger.info(f"Loaded {len(self.seen_tenders)} seen tenders")
+
+        self.near_duplicates = NearDuplicateIndex(
+            self.settings['duplicate_threshold'],
+            self.settings['message_expiration']
+        )
+        for fingerprint, seen_at, signature in self.seen_tenders.signatures():
+            self.near_duplicates.add(fingerprint, signature_from_bytes(signature), seen_at)
 
-    async def _extract_content(self, selector: str) -> Optional[str]:
+    async def _run_in_worker(self, func, *args) -> Any:
         """
-        Extract content from page using selector.
+        Run a blocking Selenium call on the browser worker executor.
         
         Args:
-            selector: CSS selector for content
+            func: Blocking callable
+            *args: Positional arguments for the callable
             
         Returns:
-            Extracted content or None if not found
+            Result of the callable
         """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    def _load_listing(self, platform: Dict[str, str]) -> Optional[List[TenderItem]]:
+        """
+        Load a listing page on a pooled browser and extract all tender items
+        in one DOM read.
+        
+        Args:
+            platform: Platform configuration dictionary
+            
+        Returns:
+            Tender items or None if the listing did not load
+        """
+        # Fails the check instead of blocking the worker if the pool is starved
+        driver = self.driver_pool.acquire(self.browser_config['acquire_timeout'])
         try:
-            element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-            )
-            return element.text
+            # Per-platform blocking rules replace the previous platform's rules
+            apply_blocking(driver, merge_config(self.browser_config, platform.get('browser')))
+            driver.get(platform['url'])
+            try:
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, platform['selector']))
+                )
+            except TimeoutException:
+                # The page loaded but has no listing: changed markup or an
+                # empty site, which recycling the browser cannot fix
+                logger.warning(f"Listing selector not found on {platform['name']}: {platform['selector']}")
+                self.driver_pool.record(driver)
+                return None
+            page_html = driver.page_source
+            self.driver_pool.record(driver)
+            return parse_listing(page_html, platform)
         except TimeoutException:
-            logger.warning(f"Timeout waiting for selector: {selector}")
-            return None
-        except Exception as e:
-            logger.error(f"Error extracting content: {str(e)}")
+            # Page load or browser command timed out: slow site or hung
+            # renderer; repeated timeouts recycle the session
+            logger.warning(f"Timeout loading {platform['name']}")
+            self.driver_pool.record(driver, ok=False)
             return None
+        except WebDriverException:
+            # The session is likely dead; swap in a warm spare
+            logger.warning(f"Browser session failed on {platform['name']}, restarting it")
+            self.driver_pool.discard(driver)
+            driver = None
+            raise
+        finally:
+            if driver is not None:
+                self.driver_pool.release(driver)
+
+    @staticmethod
+    def _shorten(text: str, limit: int = 1000) -> str:
+        """Cut text to at most limit characters."""
+        return text if len(text) <= limit else text[:limit - 1].rstrip() + '…'
+
+    @classmethod
+    def _escape_within(cls, text: str, limit: int) -> str:
+        """
+        HTML-escape text, shortening the plain text first so the escaped
+        result fits in limit characters without cutting an entity.
+        """
+        raw_limit = limit
+        while True:
+            escaped = html.escape(cls._shorten(text, raw_limit))
+            if len(escaped) <= limit or raw_limit <= 1:
+                return escaped
+            raw_limit = max(1, min(raw_limit - 1, raw_limit * limit // len(escaped)))
 
-    def _similar(self, a: str, b: str) -> float:
+    def _format_message(
+        self,
+        platform: Dict[str, str],
+        item: TenderItem,
+        matches: Dict[str, KeywordMatch]
+    ) -> str:
         """
-        Calculate similarity ratio between two strings.
+        Format the Telegram notification for a matched tender item.
         
         Args:
-            a: First string
-            b: Second string
+            platform: Platform configuration dictionary
+            item: Matched tender item
+            matches: Matched keywords of the item
             
         Returns:
-            Similarity ratio between 0 and 1
+            HTML formatted message
         """
-        return SequenceMatcher(None, a, b).ratio()
+        keywords = ', '.join(
+            f"{keyword} ({match.category})" for keyword, match in matches.items()
+        )
+        head = (
+            f"🔍 <b>New Tender Found!</b>\n\n"
+            f"📍 Platform: {html.escape(platform['name'])}\n"
+            f"🏷 Keywords: {self._escape_within(keywords, 500)}\n"
+            f"📋 Title: {self._escape_within(item.title, 500) if item.title else 'N/A'}\n\n"
+            f"📝 Description: "
+        )
+        tail = f"\n\n🔗 Link: {self._escape_within(item.link, 1000)}"
+        # The description gets whatever room is left in one Telegram message
+        room = min(1000, MAX_MESSAGE_LENGTH - len(head) - len(tail))
+        description = self._escape_within(item.description, room) if item.description else 'N/A'
+        return head + description + tail
 
-    def _should_send_message(
-        self,
-        keyword: str,
-        content: str,
-        current_time: datetime
-    ) -> bool:
+    async def _fetch_with_browser(self, platform: Dict[str, str]) -> Optional[List[TenderItem]]:
         """
-        Check if message should be sent based on duplicates and timing.
+        Load a listing through the next idle browser worker.
         
         Args:
-            keyword: Matched keyword
-            content: Message content
-            current_time: Current timestamp
+            platform: Platform configuration dictionary
             
         Returns:
-            True if message should be sent, False otherwise
+            Tender items or None if the listing did not load
         """
-        if keyword in self.last_messages:
-            last_msg = self.last_messages[keyword]
-            time_diff = current_time - last_msg['time']
-            
-            if (time_diff < timedelta(seconds=self.settings['message_expiration']) and 
-                self._similar(last_msg['message'], content) > self.settings['duplicate_threshold']):
-                return False
-        return True
+        return await self._run_in_worker(self._load_listing, platform)
 
-    def _update_last_message(
-        self,
-        keyword: str,
-        content: str,
-        current_time: datetime
-    ) -> None:
+    async def _fetch_with_http(self, platform: Dict[str, str]) -> List[TenderItem]:
         """
-        Update last message tracking.
+        Download a server-rendered listing over the pooled HTTP session.
         
         Args:
-            keyword: Matched keyword
-            content: Message content
-            current_time: Current timestamp
+            platform: Platform configuration dictionary
+            
+        Returns:
+            Tender items, empty if the page has none
+            
+        Raises:
+            ListingNotModified: If the server reports the page unchanged
+            ListingUnavailable: If the server answers with an error status
         """
-        self.last_messages[keyword] = {
-            'message': content,
-            'time': current_time
-        }
+        result = await self.http.fetch(platform['url'])
+        if result.not_modified:
+            raise ListingNotModified(platform['url'])
+        if result.status != 200:
+            raise ListingUnavailable(f"HTTP {result.status} for {platform['url']}")
+        if not result.text:
+            return []
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, parse_listing, result.text, platform)
 
-    async def _send_telegram_message(self, message: str) -> None:
+    async def _fetch_listing(self, platform: Dict[str, str]) -> Optional[List[TenderItem]]:
         """
-        Send message via Telegram.
+        Fetch a listing according to the platform's fetch mode.
+        
+        `http` only uses the HTTP client, `browser` only uses Selenium, and
+        `auto` tries HTTP first and falls back to the browser when the
+        response has no items matching the selector.
         
         Args:
-            message: Message to send
+            platform: Platform configuration dictionary
+            
+        Returns:
+            Tender items or None if the listing did not load
         """
+        mode = platform.get('fetch_mode', self.settings.get('fetch_mode', 'auto'))
+        if mode == 'browser':
+            return await self._fetch_with_browser(platform)
+
         try:
-            await self.bot.send_message(
-                chat_id=self.telegram_chat_id,
-                text=message,
-                parse_mode='HTML'
-            )
+            items = await self._fetch_with_http(platform)
+        except ListingNotModified:
+            raise
         except Exception as e:
-            logger.error(f"Error sending Telegram message: {str(e)}")
+            if mode == 'http':
+                raise
+            logger.warning(f"HTTP fetch failed for {platform['name']}: {str(e)}")
+            items = []
+
+        if items or mode == 'http':
+            return items
 
-    async def check_platform(self, platform: Dict[str, str]) -> None:
+        logger.debug(f"No items in HTTP response from {platform['name']}, using browser")
+        # The HTTP page is only a shell here, so its validators say nothing
+        # about the rendered listing
+        self.http.validators.pop(platform['url'], None)
+        return await self._fetch_with_browser(platform)
+
+    async def check_platform(self, platform: Dict[str, str]) -> str:
         """
         Check a single platform for tender matches.
         
         Args:
             platform: Platform configuration dictionary
+            
+        Returns:
+            'checked', 'unchanged' if the listing did not change since the
+            last check, or 'failed'
         """
+        started = time.monotonic()
         try:
-            self.driver.get(platform['url'])
-            content = await self._extract_content(platform['selector'])
-            
-            if not content:
-                return
-            
-            for keyword in self.keywords:
-                if keyword.lower() in content.lower():
-                    current_time = datetime.now()
+            items = await self._fetch_listing(platform)
+        except ListingNotModified:
+            return 'unchanged'
+        except Exception as e:
+            logger.error(f"Error checking platform {platform['name']}: {str(e)}")
+            return 'failed'
+        finally:
+            logger.debug(
+                f"Loaded {platform['name']} in {time.monotonic() - started:.2f}s"
+            )
+
+        if items is None:
+            return 'failed'
+
+        content_hash = listing_hash(items)
+        if self.listing_hashes.get(platform['name']) == content_hash:
+            return 'unchanged'
+        self.listing_hashes[platform['name']] = content_hash
+
+        try:
+            for item in items:
+                matches = self.matcher.match_keywords(item.text)
+                if not matches:
+                    continue
+                
+                fingerprint = tender_fingerprint(platform['name'], item.id)
+                if fingerprint in self.seen_tenders:
+                    continue
+                
+                signature = minhash(item.text)
+                duplicate = self.near_duplicates.find(signature)
+                if duplicate:
+                    logger.info(
+                        f"Skipping near duplicate on {platform['name']}: {item.title or item.id}"
+                    )
+                    self.seen_tenders.add(fingerprint)
+                    continue
+                
+                self.notifier.enqueue(self._format_message(platform, item, matches))
+                self.seen_tenders.add(fingerprint, signature=signature_to_bytes(signature))
+                self.near_duplicates.add(fingerprint, signature)
                     
-                    if self._should_send_message(keyword, content, current_time):
-                        title = await self._extract_content(platform['title_selector'])
-                        description = await self._extract_content(platform['description_selector'])
-                        
-                        message = (
-                            f"🔍 <b>New Tender Found!</b>\n\n"
-                            f"📍 Platform: {platform['name']}\n"
-                            f"🏷 Keyword: {keyword}\n"
-                            f"📋 Title: {title if title else 'N/A'}\n\n"
-                            f"📝 Description: {description if description else 'N/A'}\n\n"
-                            f"🔗 Link: {platform['url']}"
-                        )
-                        
-                        await self._send_telegram_message(message)
-                        self._update_last_message(keyword, content, current_time)
-                        
         except Exception as e:
             logger.error(f"Error checking platform {platform['name']}: {str(e)}")
+            return 'failed'
+        return 'checked'
+
+    async def _run_check(self, platform: Dict[str, str]) -> None:
+        """
+        Check a platform and feed the outcome back into the scheduler.
+        
+        Args:
+            platform: Platform configuration dictionary
+        """
+        outcome = await self.check_platform(platform)
+        delay = self.scheduler.record(platform['name'], outcome)
+        self.stats[outcome] += 1
+        logger.debug(f"{platform['name']}: {outcome}, next check in {delay:.0f}s")
+
+    def _report_stats(self, elapsed: float) -> None:
+        """
+        Log platform check counts for the last reporting window.
+        
+        Args:
+            elapsed: Length of the window in seconds
+        """
+        logger.info(
+            f"Platform checks in the last {elapsed:.0f}s: "
+            f"{self.stats['checked']} checked, {self.stats['unchanged']} unchanged, "
+            f"{self.stats['failed']} failed"
+        )
+        health = self.driver_pool.supervisor.summary()
+        logger.info(
+            f"Browsers: {health['sessions']} sessions, {health['navigations']} navigations, "
+            f"{health['errors']} errors, max RSS {health['max_rss_mb']} MiB, "
+            f"{health['replaced']} replaced"
+        )
+        self.stats = Counter()
 
     async def monitor(self) -> None:
-        """Main monitoring loop."""
+        """
+        Main monitoring loop.
+        
+        Every platform runs on its own schedule: due platforms are started as
+        independent tasks, so a slow or failing site never delays the others.
+        """
+        await self.http.start()
+        await self.notifier.start()
+
+        running: Dict[str, asyncio.Task] = {}
+        report_interval = self.settings.get('stats_interval', 300)
+        window_started = time.monotonic()
+        logger.info(f"Monitoring {len(self.platforms)} platforms with {self.worker_count} workers")
+
         try:
             while True:
-                logger.info("Starting platform checks...")
-                
-                for platform in self.platforms:
-                    await self.check_platform(platform)
-                    await asyncio.sleep(1)  # Prevent overwhelming platforms
-                
-                logger.info("Platform checks completed")
-                await asyncio.sleep(self.settings['check_interval'])
+                for platform in self.scheduler.due(running):
+                    running[platform['name']] = asyncio.create_task(
+                        self._run_check(platform)
+                    )
+
+                now = time.monotonic()
+                if now - window_started >= report_interval:
+                    self._report_stats(now - window_started)
+                    window_started = now
+                    self.seen_tenders.evict_expired()
+                    self.near_duplicates.evict_expired()
+
+                timeout = min(
+                    self.scheduler.next_due_in(running),
+                    report_interval - (now - window_started)
+                )
+                if running:
+                    done, _ = await asyncio.wait(
+                        running.values(),
+                        timeout=timeout,
+                        return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for name in [name for name, task in running.items() if task in done]:
+                        del running[name]
+                else:
+                    await asyncio.sleep(timeout)
                 
         except KeyboardInterrupt:
             logger.info("Monitoring stopped by user")
         except Exception as e:
             logger.error(f"Critical error in monitoring: {str(e)}")
         finally:
+            for task in running.values():
+                task.cancel()
+            await self.notifier.stop()
+            await self.http.close()
             self.cleanup()
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        try:
-            self.driver.quit()
-        except Exception:
-            pass
+        self.driver_pool.close()
+        self.executor.shutdown(wait=False)
+        self.seen_tenders.close()
         logger.info("Monitoring system shutdown complete")
 
 def main():
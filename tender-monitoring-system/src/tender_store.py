@@ -0,0 +1,129 @@
+"""
+Tender Store
+Persistent record of already notified tenders for constant-time deduplication.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+from typing import Dict, Iterator, Optional, Tuple
+
+
+def tender_fingerprint(platform_name: str, item_id: str) -> str:
+    """
+    Build a stable fingerprint for a tender item.
+
+    Args:
+        platform_name: Name of the platform the item was found on
+        item_id: Platform-specific item identifier
+
+    Returns:
+        Hex digest identifying the tender
+    """
+    return hashlib.sha1(f"{platform_name}\x1f{item_id}".encode('utf-8')).hexdigest()
+
+
+class SeenTenderStore:
+    """
+    SQLite-backed set of seen tender fingerprints with TTL eviction.
+
+    All fingerprints are mirrored in an in-memory dict, so lookups never hit
+    the database; SQLite only provides persistence across restarts.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        """
+        Open the store and load unexpired fingerprints.
+
+        Args:
+            path: Path to the SQLite database file
+            ttl: Seconds a fingerprint is remembered
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.ttl = ttl
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen_tenders ("
+            "fingerprint TEXT PRIMARY KEY, seen_at REAL NOT NULL, signature BLOB)"
+        )
+        columns = {
+            row[1] for row in self.connection.execute("PRAGMA table_info(seen_tenders)")
+        }
+        if 'signature' not in columns:
+            self.connection.execute("ALTER TABLE seen_tenders ADD COLUMN signature BLOB")
+        self.connection.commit()
+
+        self._index: Dict[str, float] = {}
+        self.evict_expired()
+        self._index = dict(
+            self.connection.execute("SELECT fingerprint, seen_at FROM seen_tenders")
+        )
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        seen_at = self._index.get(fingerprint)
+        return seen_at is not None and time.time() - seen_at < self.ttl
+
+    def add(
+        self,
+        fingerprint: str,
+        seen_at: Optional[float] = None,
+        signature: Optional[bytes] = None
+    ) -> None:
+        """
+        Remember a fingerprint.
+
+        Args:
+            fingerprint: Tender fingerprint
+            seen_at: Unix timestamp, defaults to now
+            signature: Serialized near-duplicate signature of the tender text
+        """
+        seen_at = time.time() if seen_at is None else seen_at
+        self._index[fingerprint] = seen_at
+        self.connection.execute(
+            "INSERT OR REPLACE INTO seen_tenders (fingerprint, seen_at, signature) "
+            "VALUES (?, ?, ?)",
+            (fingerprint, seen_at, signature)
+        )
+        self.connection.commit()
+
+    def signatures(self) -> Iterator[Tuple[str, float, bytes]]:
+        """
+        Iterate over stored near-duplicate signatures, oldest first.
+
+        Returns:
+            Iterator of (fingerprint, seen_at, signature) tuples
+        """
+        return iter(self.connection.execute(
+            "SELECT fingerprint, seen_at, signature FROM seen_tenders "
+            "WHERE signature IS NOT NULL ORDER BY seen_at"
+        ))
+
+    def evict_expired(self) -> int:
+        """
+        Drop fingerprints older than the TTL.
+
+        Returns:
+            Number of evicted fingerprints
+        """
+        cutoff = time.time() - self.ttl
+        self._index = {
+            fingerprint: seen_at
+            for fingerprint, seen_at in self._index.items()
+            if seen_at >= cutoff
+        }
+        cursor = self.connection.execute(
+            "DELETE FROM seen_tenders WHERE seen_at < ?", (cutoff,)
+        )
+        self.connection.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+import asyncio
+
+from telegram.error import NetworkError, RetryAfter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from notifier import TelegramNotifier
+
+
+class FakeBot:
+    """Bot whose send_message raises the queued errors before succeeding."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode=None):
+        if self.errors:
+            raise self.errors.pop(0)
+        self.sent.append(text)
+
+
+def make_notifier(tmp_path, errors):
+    bot = FakeBot(errors)
+    notifier = TelegramNotifier(bot, 'chat', str(tmp_path / 'outbox.db'), messages_per_minute=600)
+    for index in range(3):
+        notifier.enqueue(f"alert {index}")
+    return notifier, bot
+
+
+def outbox(notifier):
+    return notifier.connection.execute(
+        "SELECT attempts, next_attempt FROM outbox ORDER BY id"
+    ).fetchall()
+
+
+def drain(notifier):
+    """Run the sender loop until it goes idle."""
+    async def run():
+        notifier._wakeup = asyncio.Event()
+        notifier.digest_delay = 0
+        task = asyncio.create_task(notifier._run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+    asyncio.run(run())
+
+
+def test_digest_rate_limit_postpones_all_alerts_without_an_attempt(tmp_path):
+    notifier, bot = make_notifier(tmp_path, [RetryAfter(30)])
+    started = time.time()
+    drain(notifier)
+
+    rows = outbox(notifier)
+    assert bot.sent == []
+    assert len(rows) == 3
+    for attempts, next_attempt in rows:
+        assert attempts == 0
+        assert next_attempt >= started + 30
+
+
+def test_rate_limit_while_sending_one_by_one_postpones_the_rest(tmp_path):
+    notifier, bot = make_notifier(tmp_path, [NetworkError("digest failed"), RetryAfter(30)])
+    started = time.time()
+    drain(notifier)
+
+    rows = outbox(notifier)
+    assert bot.sent == []
+    assert [attempts for attempts, _ in rows] == [0, 0, 0]
+    assert all(next_attempt >= started + 30 for _, next_attempt in rows)
+
+
+def test_failed_digest_is_sent_one_by_one(tmp_path):
+    notifier, bot = make_notifier(tmp_path, [NetworkError("digest failed")])
+    drain(notifier)
+
+    assert bot.sent == ["alert 0", "alert 1", "alert 2"]
+    assert notifier.pending() == 0
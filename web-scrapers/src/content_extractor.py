@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Content Extractor
+Headless command-line extractor that streams every new version of a page
+element as Markdown to stdout or an append-only file.
+"""
+
+import sys
+import json
+import time
+import argparse
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+import shared_path  # noqa: F401 - adds shared/ to sys.path
+from driver_factory import SupervisedDriver
+from structured_content import OUTER_HTML_SCRIPT, extract_document
+
+DEFAULT_SELECTOR = "#fern-docs > main > div > article"
+# Consecutive browser failures before extraction gives up
+MAX_RESTARTS = 5
+
+
+class ContentExtractor:
+    """
+    Watches one element of one page and yields its content whenever it changes.
+
+    The browser is created on start(), not at import or construction time,
+    so many extractors can be configured and run side by side in one process
+    or one per process in batch jobs.
+    """
+
+    def __init__(self, url: str, selector: str = DEFAULT_SELECTOR, config: Optional[Dict[str, Any]] = None):
+        """
+        Store the extraction settings.
+
+        Args:
+            url: Page to open
+            selector: CSS selector of the content element
+            config: Optional 'wait_time', 'check_interval' and 'browser' settings
+        """
+        self.url = url
+        self.selector = selector
+        self.config = {
+            'wait_time': 10,
+            'check_interval': 1,
+            **(config or {})
+        }
+        self.session: Optional[SupervisedDriver] = None
+
+    def start(self) -> None:
+        """Start the browser and open the page."""
+        self.session = SupervisedDriver(self.config.get('browser'))
+        self.session.driver.get(self.url)
+
+    def stop(self) -> None:
+        """Quit the browser."""
+        if self.session is not None:
+            self.session.quit()
+            self.session = None
+
+    def extract(self) -> Optional[str]:
+        """
+        Read the element once and convert it to Markdown.
+
+        Returns:
+            Markdown content, or None if the selector did not appear in time
+
+        Raises:
+            WebDriverException: If the browser session failed
+        """
+        try:
+            html, page_url = WebDriverWait(self.session.driver, self.config['wait_time']).until(
+                lambda driver: driver.execute_script(OUTER_HTML_SCRIPT, self.selector)
+            )
+        except TimeoutException:
+            return None
+        return extract_document(html, page_url).markdown
+
+    def blocks(self, once: bool = False) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the content each time it changes.
+
+        Args:
+            once: Stop after the first block
+
+        Yields:
+            Block number and Markdown content
+
+        Raises:
+            ValueError: If the selector is invalid
+            WebDriverException: If the browser keeps failing after restarts
+        """
+        last_content = None
+        index = 0
+        failures = 0
+        # A visible browser belongs to the user, who may be navigating it:
+        # never recycle it behind their back
+        headless = self.config.get('browser', {}).get('headless', True)
+        while True:
+            try:
+                content = self.extract()
+                if headless:
+                    self.session.record(ok=content is not None)
+                    self.session.check(self.url)
+                failures = 0
+            except JavascriptException as e:
+                # The selector itself is invalid; restarting cannot fix it
+                raise ValueError(f"Invalid selector {self.selector!r}: {e.msg}") from e
+            except WebDriverException:
+                if not headless:
+                    # The user closed the visible browser window
+                    return
+                failures += 1
+                if failures > MAX_RESTARTS:
+                    raise
+                time.sleep(min(60, self.config['check_interval'] * 2 ** failures))
+                self.session.restart(self.url)
+                continue
+
+            if content and content != last_content:
+                index += 1
+                last_content = content
+                yield index, content
+                if once:
+                    return
+            elif once and content is None:
+                return
+            time.sleep(self.config['check_interval'])
+
+
+def write_block(out: TextIO, index: int, content: str, url: str, output_format: str) -> None:
+    """
+    Write one block and flush it, so readers of a pipe or file see it at once.
+
+    Args:
+        out: Output stream
+        index: Block number
+        content: Markdown content
+        url: Page URL
+        output_format: 'text' for delimited blocks, 'jsonl' for one JSON object per line
+    """
+    timestamp = datetime.now().isoformat(timespec='seconds')
+    if output_format == 'jsonl':
+        out.write(json.dumps(
+            {'block': index, 'time': timestamp, 'url': url, 'content': content},
+            ensure_ascii=False
+        ) + '\n')
+    else:
+        out.write(f"\n{'='*50}\n")
+        out.write(f"Block #{index} - {timestamp} - {url}\n")
+        out.write(f"{content}\n")
+    out.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Arguments, defaults to sys.argv[1:]
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Stream the content of a page element as Markdown.")
+    parser.add_argument('url')
+    parser.add_argument('--selector', default=DEFAULT_SELECTOR)
+    parser.add_argument('--output', '-o', default=None, help="append blocks to this file instead of stdout")
+    parser.add_argument('--format', choices=['text', 'jsonl'], default='text')
+    parser.add_argument('--interval', type=float, default=1.0, help="seconds between checks")
+    parser.add_argument('--wait', type=float, default=10.0, help="seconds to wait for the selector")
+    parser.add_argument('--once', action='store_true', help="extract one block and exit")
+    parser.add_argument('--headed', action='store_true', help="show the browser for manual navigation")
+    args = parser.parse_args(argv)
+
+    config = {
+        'wait_time': args.wait,
+        'check_interval': args.interval,
+        'browser': {
+            'headless': not args.headed,
+            # Every check counts as a navigation; recycle hourly at 1 s intervals
+            'max_navigations': 3600,
+            'page_load_strategy': 'eager',
+            'block_resources': ['image', 'font', 'media'],
+            'block_trackers': True
+        }
+    }
+
+    extractor = ContentExtractor(args.url, args.selector, config)
+    out = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+    found = False
+    try:
+        extractor.start()
+        for index, content in extractor.blocks(once=args.once):
+            found = True
+            write_block(out, index, content, args.url, args.format)
+            if args.output:
+                print(f"📝 Block #{index} appended to {args.output}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\n🛑 Extraction stopped by user", file=sys.stderr)
+    except Exception as e:
+        print(f"❌ Extraction error: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        extractor.stop()
+        if args.output:
+            out.close()
+    return 0 if found or not args.once else 2
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Documentation Crawler
+Mirrors a documentation site by following its navigation links with several
+browser workers in parallel.
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import argparse
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Deque, Dict, List, Optional, Set
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+import shared_path  # noqa: F401 - adds shared/ to sys.path
+from driver_factory import DriverPool
+from structured_content import extract_document
+
+# Reads the content and every navigation link in a single round trip
+EXTRACT_SCRIPT = """
+const [selector, linkSelector] = arguments;
+const root = document.querySelector(selector);
+return {
+    title: document.title,
+    html: root ? root.outerHTML : null,
+    links: Array.from(document.querySelectorAll(linkSelector), a => a.href)
+};
+"""
+
+SKIPPED_EXTENSIONS = (
+    '.png', '.jpg', '.jpeg', '.gif', '.svg', '.webp', '.ico',
+    '.pdf', '.zip', '.gz', '.json', '.xml', '.css', '.js'
+)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a page URL for deduplication.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        URL without fragment and with a trailing slash on the bare host
+    """
+    url, _ = urldefrag(url)
+    parsed = urlparse(url)
+    if not parsed.path:
+        url = parsed._replace(path='/').geturl()
+    return url
+
+
+class DocumentationCrawler:
+    """
+    Breadth-first crawler over the pages of one documentation site.
+
+    Links found by `link_selector` are followed when they stay under the root
+    URL's host and path. Pages are loaded by a pool of browsers, at most
+    `max_per_host` at a time per host. Progress is saved to a JSON state file,
+    so an interrupted crawl resumes where it stopped.
+    """
+
+    def __init__(self, root_url: str, config: Optional[Dict[str, Any]] = None):
+        """
+        Prepare the crawl and load saved progress.
+
+        Args:
+            root_url: Start page; only pages below its path are crawled
+            config: Dictionary containing configuration parameters
+        """
+        self.config = {
+            'selector': "#fern-docs > main > div > article",
+            'link_selector': "nav a[href], aside a[href]",
+            'wait_time': 10,
+            'workers': 3,
+            'max_per_host': 3,
+            'max_pages': 2000,
+            'max_retries': 2,
+            'save_every': 10,
+            **(config or {})
+        }
+        self.root_url = normalize_url(root_url)
+        root = urlparse(self.root_url)
+        self.scope = (root.netloc, root.path.rsplit('/', 1)[0] + '/')
+
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        self.output_dir = self.config.get('output_dir') or os.path.join(
+            script_dir, "output", "crawl", root.netloc
+        )
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.state_path = self.config.get('state_path') or os.path.join(
+            self.output_dir, "crawl_state.json"
+        )
+
+        self.frontier: Deque[str] = deque()
+        self.seen: Set[str] = set()
+        self.done: Dict[str, str] = {}
+        self.failures: Dict[str, int] = {}
+        self._load_state()
+
+    def in_scope(self, url: str) -> bool:
+        """
+        Check whether a link belongs to the crawled site section.
+
+        Args:
+            url: Absolute, normalized URL
+
+        Returns:
+            True if the page should be crawled
+        """
+        parsed = urlparse(url)
+        host, prefix = self.scope
+        return (
+            parsed.scheme in ('http', 'https')
+            and parsed.netloc == host
+            and parsed.path.startswith(prefix)
+            and not parsed.path.lower().endswith(SKIPPED_EXTENSIONS)
+        )
+
+    def _enqueue(self, url: str) -> None:
+        """Add a page to the frontier unless it was seen before."""
+        url = normalize_url(url)
+        if url not in self.seen and self.in_scope(url):
+            self.seen.add(url)
+            self.frontier.append(url)
+
+    def _load_state(self) -> None:
+        """Restore frontier and finished pages from the state file, if any."""
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            self._enqueue(self.root_url)
+            return
+
+        if state.get('root') != self.root_url:
+            print(f"⚠️ State file belongs to {state.get('root')}, starting over")
+            self._enqueue(self.root_url)
+            return
+
+        self.done = state.get('done', {})
+        self.failures = state.get('failures', {})
+        self.seen.update(self.done)
+        for url in state.get('frontier', []):
+            self._enqueue(url)
+        if not self.done and not self.frontier:
+            self._enqueue(self.root_url)
+        print(f"🔁 Resuming crawl: {len(self.done)} pages done, {len(self.frontier)} queued")
+
+    def save_state(self, in_flight: List[str] = ()) -> None:
+        """
+        Write progress atomically so a crash never leaves a truncated file.
+
+        Args:
+            in_flight: Pages being loaded right now; they are re-queued on resume
+        """
+        state = {
+            'root': self.root_url,
+            'done': self.done,
+            'failures': self.failures,
+            'frontier': list(in_flight) + list(self.frontier)
+        }
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.state_path)
+
+    def page_path(self, url: str) -> str:
+        """
+        Output file for a page, derived from its URL path.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Path of the Markdown file inside the output directory
+        """
+        parsed = urlparse(url)
+        name = re.sub(r'[^\w.-]+', '_', parsed.path.strip('/')) or 'index'
+        if parsed.query:
+            name += '_' + hashlib.sha1(parsed.query.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.output_dir, f"{name[:150]}.md")
+
+    def _fetch(self, pool: DriverPool, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a page on a pooled browser and read its content and links.
+
+        Runs in a worker thread.
+
+        Args:
+            pool: Browser pool
+            url: Page URL
+
+        Returns:
+            Title, structured content and links, or None if the page did not load
+        """
+        driver = pool.acquire()
+        try:
+            driver.get(url)
+            try:
+                WebDriverWait(driver, self.config['wait_time']).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, self.config['selector']))
+                )
+            except TimeoutException:
+                # Index pages may have navigation but no article
+                pass
+            page = driver.execute_script(
+                EXTRACT_SCRIPT, self.config['selector'], self.config['link_selector']
+            )
+            pool.record(driver)
+            if page.get('html'):
+                # Convert in the worker thread, off the scheduling loop
+                page['document'] = extract_document(page.pop('html'), url)
+            return page
+        except TimeoutException:
+            pool.record(driver, ok=False)
+            return None
+        except WebDriverException:
+            pool.discard(driver)
+            driver = None
+            raise
+        finally:
+            if driver is not None:
+                # Same site throughout, so cookies and cache are worth keeping
+                pool.release(driver, reset=False)
+
+    def _store(self, url: str, page: Dict[str, Any]) -> None:
+        """Save a page's content and queue its links."""
+        for link in page.get('links') or []:
+            self._enqueue(urljoin(url, link))
+
+        document = page.get('document')
+        if document is None:
+            self.done[url] = ''
+            return
+        path = self.page_path(url)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"<!-- {url} -->\n\n")
+            f.write(document.markdown)
+        with open(os.path.splitext(path)[0] + '.sections.json', 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'title': page.get('title'), 'sections': document.to_json()},
+                      f, ensure_ascii=False, indent=1)
+        self.done[url] = os.path.relpath(path, self.output_dir)
+
+    def _retry(self, url: str, reason: str) -> None:
+        """Requeue a failed page until it runs out of retries."""
+        self.failures[url] = self.failures.get(url, 0) + 1
+        if self.failures[url] <= self.config['max_retries']:
+            self.frontier.append(url)
+        else:
+            print(f"❌ Giving up on {url}: {reason}")
+
+    def crawl(self) -> None:
+        """
+        Crawl until the frontier is empty or `max_pages` pages are done.
+        """
+        workers = max(1, int(self.config['workers']))
+        per_host = max(1, int(self.config['max_per_host']))
+        print(f"🕷️ Crawling {self.root_url} with {workers} browsers")
+
+        pool = DriverPool(workers, self.config.get('browser'), spares=0)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='crawl-worker')
+        running: Dict[Future, str] = {}
+        host_load: Dict[str, int] = {}
+        started = time.monotonic()
+        finished = 0
+
+        try:
+            while self.frontier or running:
+                # Fill free workers, skipping hosts at their concurrency limit
+                deferred = []
+                while self.frontier and len(running) < workers:
+                    if len(self.done) + len(running) >= self.config['max_pages']:
+                        break
+                    url = self.frontier.popleft()
+                    host = urlparse(url).netloc
+                    if host_load.get(host, 0) >= per_host:
+                        deferred.append(url)
+                        continue
+                    host_load[host] = host_load.get(host, 0) + 1
+                    running[executor.submit(self._fetch, pool, url)] = url
+                self.frontier.extendleft(reversed(deferred))
+                if not running:
+                    break
+
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    url = running.pop(future)
+                    host = urlparse(url).netloc
+                    host_load[host] -= 1
+                    try:
+                        page = future.result()
+                    except Exception as e:
+                        self._retry(url, str(e))
+                        continue
+                    if page is None:
+                        self._retry(url, "page load timeout")
+                        continue
+
+                    self._store(url, page)
+                    finished += 1
+                    print(f"📄 [{len(self.done)}] {url} ({len(self.frontier)} queued)")
+                    if finished % self.config['save_every'] == 0:
+                        self.save_state(running.values())
+
+        except KeyboardInterrupt:
+            print("\n🛑 Crawl interrupted, progress saved")
+        finally:
+            self.save_state(running.values())
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            pool.close()
+
+        elapsed = time.monotonic() - started
+        rate = finished / elapsed if elapsed else 0.0
+        print(f"✅ Crawled {finished} pages in {elapsed:.0f}s ({rate:.1f} pages/s), "
+              f"{len(self.frontier)} left in the frontier")
+
+
+def main():
+    """Crawl a documentation site from the command line."""
+    parser = argparse.ArgumentParser(description="Mirror a documentation site.")
+    parser.add_argument('root_url', nargs='?', default="https://docs.paradex.trade/")
+    parser.add_argument('--selector', default="#fern-docs > main > div > article")
+    parser.add_argument('--link-selector', default="nav a[href], aside a[href]")
+    parser.add_argument('--workers', type=int, default=3)
+    parser.add_argument('--max-per-host', type=int, default=3)
+    parser.add_argument('--max-pages', type=int, default=2000)
+    parser.add_argument('--output-dir', default=None)
+    args = parser.parse_args()
+
+    config = {
+        'selector': args.selector,
+        'link_selector': args.link_selector,
+        'workers': args.workers,
+        'max_per_host': args.max_per_host,
+        'max_pages': args.max_pages,
+        'output_dir': args.output_dir,
+        'browser': {
+            'page_load_strategy': 'eager',
+            'block_resources': ['image', 'font', 'media'],
+            'block_trackers': True
+        }
+    }
+
+    try:
+        DocumentationCrawler(args.root_url, config).crawl()
+    except Exception as e:
+        print(f"❌ Program error: {str(e)}")
+
+if __name__ == "__main__":
+    main()
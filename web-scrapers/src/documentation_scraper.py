@@ -5,19 +5,57 @@ A tool for automated extraction of documentation content from web pages.
 """
 
 import os
+import re
 import json
 import time
-from datetime import datetime
 from typing import Optional, Dict, Any
+from urllib.parse import urlparse
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+
+import shared_path  # noqa: F401 - adds shared/ to sys.path
+from driver_factory import SupervisedDriver
+from snapshot_store import SnapshotStore
+from search_index import SearchIndex
+from structured_content import Document, OUTER_HTML_SCRIPT, extract_document
+
+# Consecutive page-script failures before monitoring gives up
+MAX_SCRIPT_ERRORS = 3
+
+# Installs a MutationObserver once per document and resolves when the
+# watched subtree changed since `since`, or after `timeout` ms. The result
+# is "<document id>:<version>", so a reload or new session also counts as
+# a change.
+WATCH_SCRIPT = """
+const [selector, since, timeout, settle] = arguments;
+const done = arguments[arguments.length - 1];
+let watch = window.__docWatch;
+if (!watch || watch.selector !== selector) {
+    watch = window.__docWatch = {selector, version: 0, waiters: [], timer: null};
+    const relevant = (mutations) => {
+        const root = document.querySelector(selector);
+        return !root || mutations.some(m => root.contains(m.target) || m.target.contains(root));
+    };
+    new MutationObserver((mutations) => {
+        if (!relevant(mutations)) return;
+        clearTimeout(watch.timer);
+        watch.timer = setTimeout(() => {
+            watch.version += 1;
+            watch.waiters.splice(0).forEach(resolve => resolve());
+        }, settle);
+    }).observe(document.documentElement, {childList: true, subtree: true, characterData: true});
+}
+const state = () => performance.timeOrigin + ':' + watch.version;
+if (state() !== since) { done(state()); return; }
+const resolve = () => { clearTimeout(timer); done(state()); };
+const timer = setTimeout(() => {
+    watch.waiters = watch.waiters.filter(w => w !== resolve);
+    done(state());
+}, timeout);
+watch.waiters.push(resolve);
+"""
 
 class DocumentationScraper:
     """Main scraper class for extracting documentation content."""
@@ -34,23 +72,47 @@ class DocumentationScraper:
             'wait_time': 10,
             'check_interval': 1
         }
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, self.config['wait_time'])
+        # 'poll' re-reads the content every check_interval seconds,
+        # 'observer' waits in the page for DOM mutations instead
+        self.watch_mode = self.config.get('watch_mode', 'poll')
+        self.session = self._setup_driver()
+        self._attach(self.session.driver)
+        self.store: Optional[SnapshotStore] = None
         self._setup_output_directory()
+        self.index: Optional[SearchIndex] = None
+        if self.config.get('search_index', True):
+            self.index = SearchIndex(os.path.join(self.output_dir, "search.db"))
 
-    def _setup_driver(self) -> webdriver.Chrome:
+    def _setup_driver(self) -> SupervisedDriver:
         """
-        Set up and configure Chrome WebDriver.
+        Set up a lean Chrome session that is recycled when unhealthy.
         
         Returns:
-            Configured Chrome WebDriver instance
+            Supervised browser session
+        """
+        # Content is read from outerHTML, not rendered text, so CSS does not
+        # affect it and 'stylesheet' may be added to block_resources
+        return SupervisedDriver(self.config.get('browser'))
+
+    def _attach(self, driver: webdriver.Chrome) -> None:
+        """Point the scraper at a (new) browser session."""
+        self.driver = driver
+        self.wait = WebDriverWait(self.driver, self.config['wait_time'])
+        if self.watch_mode == 'observer':
+            self.driver.set_script_timeout(self.config.get('observer_timeout', 30) + 10)
+
+    def _restart_driver(self, url: str) -> None:
         """
-        options = Options()
-        options.add_argument('--start-maximized')
-        options.add_argument('--headless')  # Run in headless mode for production
+        Replace a crashed browser session and reopen the monitored page.
         
-        service = Service(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        Args:
+            url: URL of the page being monitored
+        """
+        print("♻️ Restarting browser session")
+        try:
+            self._attach(self.session.restart(url))
+        except Exception as e:
+            print(f"❌ Browser restart failed: {str(e)}")
 
     def _setup_output_directory(self) -> None:
         """Create output directory if it doesn't exist."""
@@ -58,77 +120,181 @@ class DocumentationScraper:
         self.output_dir = os.path.join(script_dir, "output")
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def extract_content(self) -> Optional[str]:
+    def extract_document(self) -> Optional[Document]:
         """
-        Extract content from the page using configured selector.
+        Read the configured element in one DOM call and convert it in-process.
         
         Returns:
-            Extracted content or None if extraction failed
+            Markdown and section tree, or None if the selector did not appear
+
+        Raises:
+            WebDriverException: If the browser session failed
         """
         try:
-            element = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, self.config['selector']))
+            html, page_url = self.wait.until(
+                lambda driver: driver.execute_script(OUTER_HTML_SCRIPT, self.config['selector'])
             )
-            return element.text
         except TimeoutException:
             print(f"❌ Timeout waiting for content at selector: {self.config['selector']}")
             return None
-        except WebDriverException as e:
-            print(f"❌ Error extracting content: {str(e)}")
-            return None
+        return extract_document(html, page_url)
+
+    def extract_content(self) -> Optional[str]:
+        """
+        Extract content from the page using configured selector.
+        
+        Returns:
+            Content as Markdown or None if the selector did not appear
+
+        Raises:
+            WebDriverException: If the browser session failed
+        """
+        document = self.extract_document()
+        return document.markdown if document else None
 
-    def save_content(self, content: str, index: int) -> None:
+    def wait_for_change(self, since: Optional[str]) -> Optional[str]:
         """
-        Save extracted content to a file.
+        Block until the watched element changes, using an in-page MutationObserver.
+        
+        Nothing crosses the WebDriver wire while the page is idle apart from
+        one long-poll call every `observer_timeout` seconds.
         
         Args:
-            content: Content to save
-            index: Block index for the content
+            since: Watch state returned by the previous call, None at start
+            
+        Returns:
+            New watch state; equal to since if nothing changed before the timeout
+            
+        Raises:
+            WebDriverException: If the browser session failed
+        """
+        try:
+            return self.driver.execute_async_script(
+                WATCH_SCRIPT,
+                self.config['selector'],
+                since,
+                int(self.config.get('observer_timeout', 30) * 1000),
+                self.config.get('observer_settle_ms', 250)
+            )
+        except TimeoutException:
+            print("⚠️ Change watcher did not answer in time")
+            return since
+
+    def open_history(self, url: str) -> SnapshotStore:
+        """
+        Open the version history of a page in the output directory.
+        
+        Args:
+            url: URL of the page
+            
+        Returns:
+            Snapshot store for the page
+        """
+        parsed = urlparse(url)
+        name = re.sub(r'[^\w.-]+', '_', f"{parsed.netloc}/{parsed.path.strip('/')}").strip('_')
+        path = os.path.join(self.output_dir, "history", f"{name}.jsonl")
+        self.store = SnapshotStore(path, self.config.get('checkpoint_every', 20))
+        return self.store
+
+    def save_content(self, content: str, document: Optional[Document] = None) -> Optional[int]:
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"content_block_{index}_{timestamp}.txt"
-        filepath = os.path.join(self.output_dir, filename)
+        Append content to the page history as a diff against the previous version.
         
+        Args:
+            content: Content to save
+            document: Structured form of the content; its section tree is
+                written next to the history as <page>.sections.json
+            
+        Returns:
+            Version number, or None if nothing was saved
+        """
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(f"{'='*50}\n")
-                f.write(f"Block #{index} - {datetime.now()}\n")
-                f.write(f"{'='*50}\n\n")
-                f.write(content)
-            print(f"✅ Content saved to: {filepath}")
-        except IOError as e:
+            version = self.store.append(content)
+            if version is not None:
+                kind = self.store.versions()[version]['type']
+                print(f"✅ Version #{version} saved ({kind}) to: {self.store.path}")
+            if document is not None:
+                sections_path = os.path.splitext(self.store.path)[0] + ".sections.json"
+                with open(sections_path + ".tmp", "w", encoding="utf-8") as f:
+                    json.dump(
+                        {'version': version, 'sections': document.to_json()},
+                        f, ensure_ascii=False, indent=1
+                    )
+                os.replace(sections_path + ".tmp", sections_path)
+            if version is not None and self.index is not None:
+                self.index.ingest_history(self.store)
+            return version
+        except (IOError, ValueError) as e:
             print(f"❌ Error saving content: {str(e)}")
+            return None
 
     def monitor_page(self, url: str) -> None:
         """
         Monitor a page for content changes.
         
+        In 'observer' watch mode the content is only read after the page
+        reports a mutation of the selected element; otherwise it is read
+        every check_interval seconds.
+        
         Args:
             url: URL of the page to monitor
         """
         try:
             print(f"🔄 Starting page monitoring: {url}")
             self.driver.get(url)
+            self.open_history(url)
             
-            content_blocks = []
-            last_content = None
-            block_index = 1
+            # Continue from the stored history, so a restart saves nothing new
+            last_content = self.store.latest
+            watch_state = None
+            script_errors = 0
 
             while True:
                 try:
-                    current_content = self.extract_content()
+                    if self.watch_mode == 'observer':
+                        state = self.wait_for_change(watch_state)
+                        if state == watch_state:
+                            self.session.record()
+                            if self.session.check(url):
+                                self._attach(self.session.driver)
+                            continue
+                        watch_state = state
+
+                    document = self.extract_document()
+                    current_content = document.markdown if document else None
+                    self.session.record(ok=document is not None)
+                    if self.session.check(url):
+                        self._attach(self.session.driver)
                     if current_content and current_content != last_content:
-                        print(f"📝 New content detected (Block #{block_index})")
-                        content_blocks.append(current_content)
-                        self.save_content(current_content, block_index)
+                        print("📝 New content detected")
+                        self.save_content(current_content, document)
                         last_content = current_content
-                        block_index += 1
-                    time.sleep(self.config['check_interval'])
+                    script_errors = 0
+                    if self.watch_mode != 'observer':
+                        time.sleep(self.config['check_interval'])
                 except KeyboardInterrupt:
                     print("\n🛑 Monitoring stopped by user")
                     break
+                except JavascriptException as e:
+                    # The session is healthy; the script or the selector is
+                    # wrong, which a browser restart cannot fix
+                    script_errors += 1
+                    print(f"❌ Page script failed for selector {self.config['selector']!r}: {e.msg}")
+                    if script_errors >= MAX_SCRIPT_ERRORS:
+                        print("🛑 Monitoring stopped: check the selector")
+                        break
+                    time.sleep(self.config['check_interval'])
+                except WebDriverException as e:
+                    print(f"❌ Browser session failed: {str(e)}")
+                    self._restart_driver(url)
+                    time.sleep(self.config['check_interval'])
                 except Exception as e:
+                    # A hung browser surfaces as client timeouts; these count
+                    # towards the error rate that recycles the session
                     print(f"⚠️ Error during monitoring: {str(e)}")
+                    self.session.record(ok=False)
+                    if self.session.check(url):
+                        self._attach(self.session.driver)
                     time.sleep(self.config['check_interval'])
 
         except Exception as e:
@@ -138,10 +304,9 @@ class DocumentationScraper:
 
     def cleanup(self) -> None:
         """Clean up resources."""
-        try:
-            self.driver.quit()
-        except Exception:
-            pass
+        self.session.quit()
+        if self.index is not None:
+            self.index.close()
         print("👋 Scraper shutdown complete")
 
 def main():
@@ -150,7 +315,16 @@ def main():
     config = {
         'selector': "#fern-docs > main > div > article",
         'wait_time': 10,
-        'check_interval': 1
+        'check_interval': 1,
+        'watch_mode': 'observer',
+        'observer_timeout': 30,
+        'browser': {
+            'page_load_strategy': 'eager',
+            'block_resources': ['image', 'font', 'media'],
+            'block_trackers': True,
+            # Checks count as navigations: hourly when polling every second
+            'max_navigations': 3600
+        }
     }
 
     # Target URL
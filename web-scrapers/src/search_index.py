@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Search Index
+SQLite FTS5 full-text index over the page histories written by the
+Documentation Scraper, with a query command line.
+"""
+
+import os
+import re
+import glob
+import sqlite3
+import hashlib
+import argparse
+from typing import Any, Dict, List, Optional, Tuple
+
+from snapshot_store import SnapshotStore
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*\S)\s*$')
+FENCE_PATTERN = re.compile(r'^(```|~~~)')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    sha TEXT UNIQUE NOT NULL,
+    page TEXT NOT NULL,
+    heading TEXT NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS chunks_fts USING fts5(
+    heading, body, content='chunks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    chunk_id INTEGER NOT NULL,
+    page TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    PRIMARY KEY (chunk_id, page, version)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS ingested (
+    page TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+
+def split_sections(markdown: str) -> List[Tuple[str, str]]:
+    """
+    Cut Markdown into chunks at headings, ignoring '#' lines inside code fences.
+
+    Args:
+        markdown: Page content
+
+    Returns:
+        (heading path joined with ' > ', body) per non-empty chunk
+    """
+    chunks: List[Tuple[str, str]] = []
+    path: List[Tuple[int, str]] = []
+    body: List[str] = []
+    in_fence = False
+
+    def flush() -> None:
+        text = '\n'.join(body).strip()
+        if text:
+            chunks.append((' > '.join(title for _, title in path), text))
+        body.clear()
+
+    for line in markdown.splitlines():
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        heading = None if in_fence else HEADING_PATTERN.match(line)
+        if heading:
+            flush()
+            level = len(heading.group(1))
+            path = [(lvl, title) for lvl, title in path if lvl < level]
+            path.append((level, heading.group(2)))
+        else:
+            body.append(line)
+    flush()
+    return chunks
+
+
+def fts_query(query: str) -> str:
+    """Quote every term so user input never trips the FTS5 query syntax."""
+    terms = re.findall(r'\w+', query)
+    return ' '.join('"' + term + '"' for term in terms)
+
+
+class SearchIndex:
+    """
+    Inverted index of page sections across all stored versions.
+
+    Each distinct section text is stored and indexed once; every version it
+    appears in is recorded as an occurrence. Months of mostly unchanged
+    snapshots therefore cost little more than their changes.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open or create the index database.
+
+        Args:
+            path: Path to the SQLite file
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        self.connection.close()
+
+    def _chunk_id(self, page: str, heading: str, body: str) -> int:
+        """Look up a chunk by content, inserting and indexing it if new."""
+        sha = hashlib.sha1(f"{page}\x1f{heading}\x1f{body}".encode('utf-8')).hexdigest()
+        row = self.connection.execute("SELECT id FROM chunks WHERE sha = ?", (sha,)).fetchone()
+        if row:
+            return row[0]
+        cursor = self.connection.execute(
+            "INSERT INTO chunks (sha, page, heading, body) VALUES (?, ?, ?, ?)",
+            (sha, page, heading, body)
+        )
+        self.connection.execute(
+            "INSERT INTO chunks_fts (rowid, heading, body) VALUES (?, ?, ?)",
+            (cursor.lastrowid, heading, body)
+        )
+        return cursor.lastrowid
+
+    def ingest_history(self, store: SnapshotStore, page: Optional[str] = None) -> int:
+        """
+        Index the versions of a page history that are not indexed yet.
+
+        Args:
+            store: Page history
+            page: Page name, defaults to the history file name
+
+        Returns:
+            Number of versions indexed
+        """
+        page = page or os.path.splitext(os.path.basename(store.path))[0]
+        row = self.connection.execute(
+            "SELECT version FROM ingested WHERE page = ?", (page,)
+        ).fetchone()
+        start = row[0] + 1 if row else 0
+
+        count = 0
+        for record, text in store.iter_versions(start):
+            for heading, body in split_sections(text):
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO occurrences (chunk_id, page, version, time) "
+                    "VALUES (?, ?, ?, ?)",
+                    (self._chunk_id(page, heading, body), page, record['version'], record['time'])
+                )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO ingested (page, version) VALUES (?, ?)",
+                (page, record['version'])
+            )
+            count += 1
+        self.connection.commit()
+        return count
+
+    def ingest_directory(self, directory: str) -> int:
+        """
+        Index new versions of every history file in a directory.
+
+        Args:
+            directory: Directory with *.jsonl history files
+
+        Returns:
+            Number of versions indexed
+        """
+        total = 0
+        for path in sorted(glob.glob(os.path.join(directory, '*.jsonl'))):
+            total += self.ingest_history(SnapshotStore(path))
+        return total
+
+    def search(self, query: str, limit: int = 10, page: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Find the best matching sections.
+
+        Args:
+            query: Words to search for; FTS5 syntax is used when valid
+            limit: Maximum number of hits
+            page: Only search this page
+
+        Returns:
+            Hits ordered by BM25 rank, with snippet and the versions and
+            times the section was seen in
+        """
+        sql = (
+            "SELECT c.id, c.page, c.heading, "
+            "snippet(chunks_fts, 1, '[', ']', '…', 16), bm25(chunks_fts, 4.0, 1.0) AS rank "
+            "FROM chunks_fts JOIN chunks c ON c.id = chunks_fts.rowid "
+            "WHERE chunks_fts MATCH ?" + (" AND c.page = ?" if page else "") +
+            " ORDER BY rank, c.id DESC LIMIT ?"
+        )
+        params: List[Any] = [query] + ([page] if page else []) + [limit]
+        try:
+            rows = self.connection.execute(sql, params).fetchall()
+        except sqlite3.OperationalError:
+            params[0] = fts_query(query)
+            if not params[0]:
+                return []
+            rows = self.connection.execute(sql, params).fetchall()
+
+        hits = []
+        for chunk_id, chunk_page, heading, snippet, rank in rows:
+            first_version, last_version, first_seen, last_seen = self.connection.execute(
+                "SELECT MIN(version), MAX(version), MIN(time), MAX(time) "
+                "FROM occurrences WHERE chunk_id = ?", (chunk_id,)
+            ).fetchone()
+            hits.append({
+                'page': chunk_page,
+                'heading': heading,
+                'snippet': snippet,
+                'rank': rank,
+                'first_version': first_version,
+                'last_version': last_version,
+                'first_seen': first_seen,
+                'last_seen': last_seen
+            })
+        return hits
+
+
+def main():
+    """Index page histories and search them from the command line."""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    output_dir = os.path.join(script_dir, "output")
+
+    parser = argparse.ArgumentParser(description="Search scraped documentation history.")
+    parser.add_argument('--db', default=os.path.join(output_dir, "search.db"))
+    commands = parser.add_subparsers(dest='command', required=True)
+    index_parser = commands.add_parser('index', help="index new versions of all histories")
+    index_parser.add_argument('directory', nargs='?', default=os.path.join(output_dir, "history"))
+    search_parser = commands.add_parser('search', help="search indexed sections")
+    search_parser.add_argument('query')
+    search_parser.add_argument('-n', '--limit', type=int, default=10)
+    search_parser.add_argument('--page', default=None)
+    args = parser.parse_args()
+
+    index = SearchIndex(args.db)
+    try:
+        if args.command == 'index':
+            count = index.ingest_directory(args.directory)
+            print(f"✅ Indexed {count} new versions")
+            return
+
+        hits = index.search(args.query, args.limit, args.page)
+        if not hits:
+            print("No matches")
+        for hit in hits:
+            versions = f"v{hit['first_version']}" if hit['first_version'] == hit['last_version'] \
+                else f"v{hit['first_version']}-v{hit['last_version']}"
+            print(f"📄 {hit['page']} › {hit['heading'] or '(top)'}  [{versions}, last seen {hit['last_seen']}]")
+            print(f"   {' '.join(hit['snippet'].split())}")
+    finally:
+        index.close()
+
+if __name__ == "__main__":
+    main()
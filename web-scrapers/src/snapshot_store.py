@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Snapshot Store
+Append-only, content-addressed history of a text document that stores line
+diffs between versions and periodic full checkpoints.
+"""
+
+import os
+import json
+import hashlib
+import argparse
+from datetime import datetime
+from difflib import SequenceMatcher
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+Op = List[Union[str, int, List[str]]]
+
+
+def content_hash(text: str) -> str:
+    """SHA-256 of a text, used as its address in the store."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def diff_ops(old: List[str], new: List[str]) -> List[Op]:
+    """
+    Describe how to turn one list of lines into another.
+
+    Args:
+        old: Lines of the previous version
+        new: Lines of the new version
+
+    Returns:
+        Opcodes: ['=', n] keeps n lines, ['-', n] drops n lines,
+        ['+', lines] inserts lines
+    """
+    ops: List[Op] = []
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(['=', i2 - i1])
+            continue
+        if tag in ('delete', 'replace'):
+            ops.append(['-', i2 - i1])
+        if tag in ('insert', 'replace'):
+            ops.append(['+', new[j1:j2]])
+    return ops
+
+
+def apply_ops(old: List[str], ops: List[Op]) -> List[str]:
+    """
+    Rebuild a version from its predecessor and the opcodes from diff_ops().
+
+    Args:
+        old: Lines of the previous version
+        ops: Opcodes of the new version
+
+    Returns:
+        Lines of the new version
+    """
+    new: List[str] = []
+    position = 0
+    for op, arg in ops:
+        if op == '=':
+            new.extend(old[position:position + arg])
+            position += arg
+        elif op == '-':
+            position += arg
+        else:
+            new.extend(arg)
+    return new
+
+
+class SnapshotStore:
+    """
+    Version history of one document in a single append-only JSON-lines file.
+
+    Every version is addressed by the SHA-256 of its text. A new version is
+    written as a line diff against the previous one, a full checkpoint every
+    `checkpoint_every` versions (or when the diff is not smaller than the
+    text), and a bare reference when the text equals an earlier version.
+    Writing a version therefore costs I/O proportional to what changed, and
+    reading one replays at most `checkpoint_every` diffs.
+    """
+
+    def __init__(self, path: str, checkpoint_every: int = 20):
+        """
+        Open or create a history file and index its versions.
+
+        Args:
+            path: Path to the history file
+            checkpoint_every: Maximum number of diffs between full copies
+        """
+        self.path = path
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.records: List[Dict[str, Any]] = []
+        self.offsets: List[int] = []
+        self.by_hash: Dict[str, int] = {}
+        self._since_checkpoint = 0
+        self._current: List[str] = []
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._index()
+
+    def _index(self) -> None:
+        """Scan the history file, keeping record headers and offsets only."""
+        if not os.path.exists(self.path):
+            return
+        offset = 0
+        with open(self.path, 'rb') as f:
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break
+                self._register(json.loads(raw), offset)
+                offset += len(raw)
+        if offset < os.path.getsize(self.path):
+            # Torn last write from a crash; drop it
+            with open(self.path, 'r+b') as f:
+                f.truncate(offset)
+        if self.records:
+            self._current = self._lines(len(self.records) - 1)
+            last_full = max(i for i, r in enumerate(self.records) if r['type'] == 'full')
+            self._since_checkpoint = len(self.records) - 1 - last_full
+
+    def _register(self, record: Dict[str, Any], offset: int) -> None:
+        """Add a record header to the in-memory index."""
+        header = {key: record[key] for key in ('version', 'time', 'sha', 'type')}
+        self.records.append(header)
+        self.offsets.append(offset)
+        self.by_hash.setdefault(record['sha'], record['version'])
+
+    def _read(self, version: int) -> Dict[str, Any]:
+        """Load the full record of a version from disk."""
+        with open(self.path, 'rb') as f:
+            f.seek(self.offsets[version])
+            return json.loads(f.readline())
+
+    def _lines(self, version: int) -> List[str]:
+        """Reconstruct the lines of a version from the nearest checkpoint."""
+        record = self._read(version)
+        if record['type'] == 'full':
+            return record['lines']
+        if record['type'] == 'ref':
+            return self._lines(self.by_hash[record['sha']])
+        return apply_ops(self._lines(version - 1), record['ops'])
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @property
+    def latest(self) -> Optional[str]:
+        """Text of the newest version, None if the store is empty."""
+        return ''.join(self._current) if self.records else None
+
+    def versions(self) -> List[Dict[str, Any]]:
+        """
+        List stored versions.
+
+        Returns:
+            Version number, timestamp, content hash and record type per version
+        """
+        return list(self.records)
+
+    def get(self, version: int) -> str:
+        """
+        Reconstruct any stored version.
+
+        Args:
+            version: Version number, negative values count from the end
+
+        Returns:
+            Text of the version
+        """
+        if version < 0:
+            version += len(self.records)
+        if not 0 <= version < len(self.records):
+            raise IndexError(f"No version {version} in {self.path}")
+        return ''.join(self._lines(version))
+
+    def iter_versions(self, start: int = 0) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """
+        Replay versions in order, applying each diff once.
+
+        Args:
+            start: First version to yield
+
+        Yields:
+            Record header and text of each version from start on
+        """
+        if start >= len(self.records):
+            return
+        lines = self._lines(start)
+        yield self.records[start], ''.join(lines)
+        for version in range(start + 1, len(self.records)):
+            record = self._read(version)
+            if record['type'] == 'full':
+                lines = record['lines']
+            elif record['type'] == 'ref':
+                lines = self._lines(self.by_hash[record['sha']])
+            else:
+                lines = apply_ops(lines, record['ops'])
+            yield self.records[version], ''.join(lines)
+
+    def append(self, text: str) -> Optional[int]:
+        """
+        Store a new version unless it equals the newest one.
+
+        Args:
+            text: Full text of the new version
+
+        Returns:
+            New version number, or None if nothing was written
+        """
+        sha = content_hash(text)
+        if self.records and self.records[-1]['sha'] == sha:
+            return None
+
+        lines = text.splitlines(keepends=True)
+        record: Dict[str, Any] = {
+            'version': len(self.records),
+            'time': datetime.now().isoformat(timespec='seconds'),
+            'sha': sha
+        }
+        if sha in self.by_hash:
+            record['type'] = 'ref'
+        else:
+            ops = diff_ops(self._current, lines) if self.records else None
+            changed = sum(len(arg) for op, arg in ops if op == '+') if ops else len(lines)
+            if ops is None or self._since_checkpoint + 1 >= self.checkpoint_every or changed >= len(lines):
+                record.update(type='full', lines=lines)
+            else:
+                record.update(type='diff', ops=ops)
+
+        raw = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
+            f.write(raw)
+        self._register(record, offset)
+        self._since_checkpoint = 0 if record['type'] == 'full' else self._since_checkpoint + 1
+        self._current = lines
+        return record['version']
+
+
+def main():
+    """List or reconstruct versions of a history file."""
+    parser = argparse.ArgumentParser(description="Inspect a snapshot history file.")
+    parser.add_argument('path', help="history .jsonl file")
+    parser.add_argument('--version', type=int, help="print this version (-1 for the newest)")
+    args = parser.parse_args()
+
+    store = SnapshotStore(args.path)
+    if args.version is None:
+        for record in store.versions():
+            print(f"#{record['version']:<5} {record['time']}  {record['type']:<4}  {record['sha'][:12]}")
+    else:
+        print(store.get(args.version), end='')
+
+if __name__ == "__main__":
+    main()
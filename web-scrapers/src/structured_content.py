@@ -0,0 +1,299 @@
+"""
+Structured Content
+Converts the HTML of a documentation article into Markdown and a JSON
+section tree (heading path, text, code blocks and tables per section).
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+from bs4.element import PreformattedString
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Returns [outerHTML, page URL] of the first match, or null while it is missing
+OUTER_HTML_SCRIPT = """
+const element = document.querySelector(arguments[0]);
+return element ? [element.outerHTML, location.href] : null;
+"""
+
+SKIPPED_TAGS = {'script', 'style', 'noscript', 'template', 'svg', 'button', 'iframe', 'form'}
+HEADINGS = {'h1': 1, 'h2': 2, 'h3': 3, 'h4': 4, 'h5': 5, 'h6': 6}
+BLOCK_TAGS = ['p', 'pre', 'ul', 'ol', 'table', 'blockquote', 'hr', 'dl'] + list(HEADINGS)
+
+
+@dataclass
+class Block:
+    """One block-level piece of an article."""
+    kind: str
+    markdown: str
+    level: int = 0
+    code: Optional[Dict[str, str]] = None
+    table: Optional[List[List[str]]] = None
+
+
+@dataclass
+class Section:
+    """Article content under one heading."""
+    heading: str
+    level: int
+    path: List[str]
+    text: str = ''
+    code: List[Dict[str, str]] = field(default_factory=list)
+    tables: List[List[List[str]]] = field(default_factory=list)
+    children: List['Section'] = field(default_factory=list)
+
+
+@dataclass
+class Document:
+    """Markdown and section tree of one article."""
+    markdown: str
+    sections: List[Section]
+
+    def to_json(self) -> List[Dict[str, Any]]:
+        """Section tree as plain dictionaries for json.dump()."""
+        return [asdict(section) for section in self.sections]
+
+
+def _squash(text: str) -> str:
+    """Collapse runs of whitespace the way a browser renders inline text."""
+    return re.sub(r'\s+', ' ', text)
+
+
+def _code_language(element: Tag) -> str:
+    """Read the language from language-xxx / lang-xxx classes of a code block."""
+    for node in [element] + element.find_all(True):
+        for cls in node.get('class', []):
+            match = re.match(r'(?:language|lang)-([\w+#-]+)', cls)
+            if match:
+                return match.group(1)
+    return ''
+
+
+class MarkdownConverter:
+    """Turns an HTML element into Markdown blocks."""
+
+    def __init__(self, base_url: str = ''):
+        """
+        Args:
+            base_url: URL of the page, used to absolutize links
+        """
+        self.base_url = base_url
+
+    def inline(self, node) -> str:
+        """Render inline content of a node as Markdown."""
+        if isinstance(node, PreformattedString):
+            # Comments, doctypes and CDATA
+            return ''
+        if isinstance(node, NavigableString):
+            return _squash(str(node))
+        if not isinstance(node, Tag) or node.name in SKIPPED_TAGS:
+            return ''
+
+        name = node.name
+        if name == 'br':
+            return '  \n'
+        if name == 'code':
+            code = node.get_text()
+            fence = '``' if '`' in code else '`'
+            return f"{fence}{code}{fence}"
+        if name == 'img':
+            src = urljoin(self.base_url, node.get('src', ''))
+            return f"![{node.get('alt', '')}]({src})"
+
+        text = ''.join(self.inline(child) for child in node.children)
+        if name == 'a' and node.get('href') and text.strip():
+            href = node['href']
+            if not href.startswith('#'):
+                href = urljoin(self.base_url, href)
+            return f"[{text.strip()}]({href})"
+        if name in ('strong', 'b') and text.strip():
+            return f"**{text.strip()}**"
+        if name in ('em', 'i') and text.strip():
+            return f"*{text.strip()}*"
+        return text
+
+    def _inline_text(self, node: Tag) -> str:
+        return re.sub(r' *\n *', '\n', self.inline(node)).strip()
+
+    def _list(self, node: Tag, depth: int = 0) -> str:
+        lines = []
+        ordered = node.name == 'ol'
+        for number, item in enumerate(node.find_all('li', recursive=False), 1):
+            marker = f"{number}." if ordered else '-'
+            nested = [child for child in item.children if isinstance(child, Tag) and child.name in ('ul', 'ol')]
+            parts = [child for child in item.children if child not in nested]
+            text = ''.join(self.inline(child) for child in parts).strip()
+            lines.append(f"{'  ' * depth}{marker} {text}")
+            for sub_list in nested:
+                lines.append(self._list(sub_list, depth + 1))
+        return '\n'.join(lines)
+
+    def _table(self, node: Tag) -> List[List[str]]:
+        rows = []
+        for row in node.find_all('tr'):
+            cells = row.find_all(['th', 'td'], recursive=False)
+            rows.append([self._inline_text(cell).replace('\n', ' ') for cell in cells])
+        return [row for row in rows if row]
+
+    @staticmethod
+    def _table_markdown(rows: List[List[str]]) -> str:
+        width = max(len(row) for row in rows)
+        rows = [[cell.replace('|', '\\|') for cell in row] + [''] * (width - len(row)) for row in rows]
+        lines = ['| ' + ' | '.join(rows[0]) + ' |', '|' + ' --- |' * width]
+        lines += ['| ' + ' | '.join(row) + ' |' for row in rows[1:]]
+        return '\n'.join(lines)
+
+    def blocks(self, node: Tag) -> List[Block]:
+        """
+        Split an element into Markdown blocks in document order.
+
+        Args:
+            node: Root element of the article
+
+        Returns:
+            Headings, paragraphs, lists, code blocks and tables
+        """
+        result: List[Block] = []
+        pending: List[str] = []
+
+        def flush() -> None:
+            text = re.sub(r' *\n *', '\n', ''.join(pending)).strip()
+            if text:
+                result.append(Block('text', text))
+            pending.clear()
+
+        for child in node.children:
+            if isinstance(child, NavigableString):
+                pending.append(self.inline(child))
+                continue
+            if not isinstance(child, Tag) or child.name in SKIPPED_TAGS:
+                continue
+
+            name = child.name
+            if name not in BLOCK_TAGS and not child.find(BLOCK_TAGS):
+                # Inline element, or a wrapper around inline content only
+                if name in ('div', 'section', 'li', 'dt', 'dd', 'figcaption'):
+                    flush()
+                    pending.append(self.inline(child))
+                    flush()
+                else:
+                    pending.append(self.inline(child))
+                continue
+
+            flush()
+            if name in HEADINGS:
+                text = self._inline_text(child).replace('\n', ' ')
+                if text:
+                    level = HEADINGS[name]
+                    result.append(Block('heading', f"{'#' * level} {text}", level=level))
+            elif name == 'p':
+                text = self._inline_text(child)
+                if text:
+                    result.append(Block('text', text))
+            elif name == 'pre':
+                code = child.get_text().rstrip('\n')
+                language = _code_language(child)
+                fence = '````' if '```' in code else '```'
+                result.append(Block(
+                    'code', f"{fence}{language}\n{code}\n{fence}",
+                    code={'language': language, 'code': code}
+                ))
+            elif name in ('ul', 'ol'):
+                text = self._list(child)
+                if text.strip():
+                    result.append(Block('text', text))
+            elif name == 'table':
+                rows = self._table(child)
+                if rows:
+                    result.append(Block('table', self._table_markdown(rows), table=rows))
+            elif name == 'blockquote':
+                inner = '\n\n'.join(block.markdown for block in self.blocks(child))
+                if inner:
+                    result.append(Block('text', '\n'.join(f"> {line}".rstrip() for line in inner.split('\n'))))
+            elif name == 'hr':
+                result.append(Block('text', '---'))
+            else:
+                # Layout container: descend
+                result.extend(self.blocks(child))
+        flush()
+        return result
+
+
+def build_sections(blocks: List[Block]) -> List[Section]:
+    """
+    Nest blocks under their headings.
+
+    Content before the first heading goes into a section with an empty heading.
+
+    Args:
+        blocks: Blocks from MarkdownConverter.blocks()
+
+    Returns:
+        Top-level sections, each holding its subsections
+    """
+    roots: List[Section] = []
+    stack: List[Section] = []
+    texts: Dict[int, List[str]] = {}
+
+    def current() -> Section:
+        if not stack:
+            section = Section(heading='', level=0, path=[])
+            roots.append(section)
+            stack.append(section)
+        return stack[-1]
+
+    for block in blocks:
+        if block.kind == 'heading':
+            while stack and stack[-1].level >= block.level:
+                stack.pop()
+            heading = block.markdown.lstrip('#').strip()
+            parent = stack[-1] if stack else None
+            section = Section(
+                heading=heading,
+                level=block.level,
+                path=(parent.path if parent else []) + [heading]
+            )
+            (parent.children if parent else roots).append(section)
+            stack.append(section)
+            continue
+
+        section = current()
+        texts.setdefault(id(section), []).append(block.markdown)
+        if block.code:
+            section.code.append(block.code)
+        if block.table:
+            section.tables.append(block.table)
+
+    def fill(sections: List[Section]) -> None:
+        for section in sections:
+            section.text = '\n\n'.join(texts.get(id(section), []))
+            fill(section.children)
+
+    fill(roots)
+    return roots
+
+
+def extract_document(html: str, base_url: str = '') -> Document:
+    """
+    Convert an article's HTML into Markdown and a section tree.
+
+    Args:
+        html: outerHTML of the article element, or a full page
+        base_url: URL of the page, used to absolutize links
+
+    Returns:
+        Document with Markdown text and nested sections
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    root = soup.body or soup
+    blocks = MarkdownConverter(base_url).blocks(root)
+    markdown = '\n\n'.join(block.markdown for block in blocks) + '\n'
+    return Document(markdown=markdown, sections=build_sections(blocks))
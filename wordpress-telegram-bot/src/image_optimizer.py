@@ -0,0 +1,204 @@
+"""
+Image Optimizer Module
+Re-encodes photos before upload and detects their real MIME type
+"""
+
+import io
+import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Optional, Tuple, Union
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
+try:
+    import magic
+except ImportError:
+    magic = None
+
+# Bytes needed to recognise an image format
+HEADER_SIZE = 2048
+
+EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'image/heic': '.heic'
+}
+
+OUTPUT_FORMATS = {
+    'webp': ('WEBP', 'image/webp'),
+    'jpeg': ('JPEG', 'image/jpeg')
+}
+
+def detect_mime(header: bytes) -> str:
+    """
+    Detect the MIME type of an image from its first bytes.
+
+    Args:
+        header: Start of the file
+
+    Returns:
+        MIME type, image/jpeg if the format is not recognised
+    """
+    if magic is not None:
+        mime = magic.from_buffer(header, mime=True)
+        if mime in EXTENSIONS:
+            return mime
+
+    if header.startswith(b'\xff\xd8\xff'):
+        return 'image/jpeg'
+    if header.startswith(b'\x89PNG\r\n\x1a\n'):
+        return 'image/png'
+    if header[:6] in (b'GIF87a', b'GIF89a'):
+        return 'image/gif'
+    if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+        return 'image/webp'
+    if header[4:12] in (b'ftypheic', b'ftypheix', b'ftypmif1'):
+        return 'image/heic'
+    return 'image/jpeg'
+
+def optimize_image(
+    data: Union[bytes, str],
+    output_format: str,
+    max_dimension: int,
+    quality: int
+) -> Optional[bytes]:
+    """
+    Re-encode an image; runs in a worker process.
+
+    The EXIF orientation is applied to the pixels and all metadata is
+    dropped, since Pillow only writes EXIF when it is passed explicitly.
+
+    Args:
+        data: Original image bytes, or the path of a file containing them
+        output_format: 'webp' or 'jpeg'
+        max_dimension: Longest side in pixels after resizing
+        quality: Encoder quality from 1 to 100
+
+    Returns:
+        Re-encoded image bytes, or None for images that should be uploaded
+        as they are: animated ones, and ones that needed no resizing and
+        would not get smaller
+    """
+    pil_format = OUTPUT_FORMATS[output_format][0]
+    with Image.open(data if isinstance(data, str) else io.BytesIO(data)) as original:
+        if getattr(original, 'is_animated', False):
+            return None
+        image = ImageOps.exif_transpose(original)
+        size = image.size
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+        resized = image.size != size
+
+        has_alpha = image.mode in ('RGBA', 'LA') or 'transparency' in image.info
+        if pil_format == 'WEBP':
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+            options = {'quality': quality, 'method': 4}
+        else:
+            image = image.convert('RGB')
+            options = {'quality': quality, 'optimize': True, 'progressive': True}
+
+        output = io.BytesIO()
+        image.save(output, format=pil_format, **options)
+        original_size = os.path.getsize(data) if isinstance(data, str) else len(data)
+        if not resized and output.tell() >= original_size:
+            # Already compressed harder than this, e.g. a low quality JPEG
+            return None
+        return output.getvalue()
+
+class ImageOptimizer:
+    def __init__(
+        self,
+        enabled: bool = False,
+        output_format: str = 'webp',
+        max_dimension: int = 2048,
+        quality: int = 82,
+        workers: Optional[int] = None
+    ):
+        """
+        Initialize optimization settings.
+
+        Decoding and encoding are CPU bound, so they run in a process pool
+        that is started on first use and never blocks the event loop.
+        At most `workers` photos are optimized at a time; the others wait
+        with their spools unread. Photos already on disk are passed to the
+        workers by path, so only small in-memory spools are copied into
+        the pool.
+
+        Args:
+            enabled: Re-encode photos before upload; needs Pillow
+            output_format: 'webp' or 'jpeg'
+            max_dimension: Longest side in pixels after resizing
+            quality: Encoder quality from 1 to 100
+            workers: Worker processes, defaults to up to 2
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unsupported image format: {output_format}")
+        if enabled and Image is None:
+            print("⚠️ Pillow is not installed, image optimization is disabled")
+            enabled = False
+
+        self.enabled = enabled
+        self.output_format = output_format
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.workers = workers or min(2, os.cpu_count() or 1)
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._slots = asyncio.Semaphore(self.workers)
+
+    async def process(self, source: BinaryIO) -> Tuple[BinaryIO, str]:
+        """
+        Prepare a downloaded photo for upload.
+
+        Args:
+            source: Readable binary file with the photo
+
+        Returns:
+            File to upload and its MIME type; the source itself when it is
+            uploaded unchanged
+        """
+        source.seek(0)
+        header = source.read(HEADER_SIZE)
+        mime = detect_mime(header)
+        if not self.enabled:
+            return source, mime
+
+        async with self._slots:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers)
+            path = getattr(source, 'name', None)
+            if isinstance(path, str) and os.path.isfile(path):
+                source.flush()
+                data = path
+            else:
+                source.seek(0)
+                data = source.read()
+            loop = asyncio.get_running_loop()
+            try:
+                optimized = await loop.run_in_executor(
+                    self.executor,
+                    optimize_image,
+                    data,
+                    self.output_format,
+                    self.max_dimension,
+                    self.quality
+                )
+            except Exception as e:
+                print(f"⚠️ Image optimization failed, uploading original: {e}")
+                return source, mime
+        if optimized is None:
+            source.seek(0)
+            return source, mime
+
+        source.close()
+        return io.BytesIO(optimized), OUTPUT_FORMATS[self.output_format][1]
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
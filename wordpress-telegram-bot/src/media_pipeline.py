@@ -0,0 +1,261 @@
+"""
+Media Pipeline Module
+Transfers Telegram photos to the WordPress media library in the background
+"""
+
+import io
+import os
+import asyncio
+import tempfile
+from typing import Any, AsyncIterator, Awaitable, BinaryIO, Callable, Dict, List, Optional, Set
+from urllib.parse import urlparse
+
+import aiohttp
+
+from wp_handler import WordPressHandler
+from image_optimizer import EXTENSIONS, ImageOptimizer
+
+# Read and write size for streamed transfers
+CHUNK_SIZE = 64 * 1024
+
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+# Background transfer resolving to media details, or None on failure
+UploadTask = asyncio.Task
+
+class MediaPipeline:
+    def __init__(
+        self,
+        wp_handler: WordPressHandler,
+        download_concurrency: int = 4,
+        upload_concurrency: int = 3,
+        retries: int = 2,
+        retry_delay: float = 1.0,
+        spool_size: int = 512 * 1024,
+        optimizer: Optional[ImageOptimizer] = None
+    ):
+        """
+        Initialize the pipeline limits.
+
+        Downloads and uploads have separate limits, so while one photo is
+        uploading to WordPress the next ones are already downloading from
+        Telegram.
+
+        Photos are streamed: a download is written chunk by chunk to a
+        spool that stays in memory up to `spool_size` bytes and moves to a
+        named temporary file beyond that, and the upload reads it back in
+        chunks.
+        Memory per transfer is therefore bounded by `spool_size`, and
+        upload retries do not download the photo again.
+
+        Args:
+            wp_handler: Handler used for uploads
+            download_concurrency: Maximum parallel Telegram downloads
+            upload_concurrency: Maximum parallel WordPress uploads
+            retries: Extra attempts per stage before a photo is given up
+            retry_delay: Delay before the first retry, doubled on each attempt
+            spool_size: Bytes of a photo kept in memory before spilling to disk
+            optimizer: Processing applied to each photo before upload; by
+                default photos are uploaded unchanged with their real MIME type
+        """
+        self.wp_handler = wp_handler
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.spool_size = spool_size
+        self.optimizer = optimizer or ImageOptimizer()
+        self.download_concurrency = max(1, download_concurrency)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._downloads = asyncio.Semaphore(self.download_concurrency)
+        self._uploads = asyncio.Semaphore(max(1, upload_concurrency))
+        self._background: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        """Open the download session; must be called from the running event loop."""
+        if self.session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.download_concurrency,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=120)
+        )
+
+    async def _download(self, bot: Any, file_id: str) -> BinaryIO:
+        """
+        Download a Telegram file into a spool, chunk by chunk.
+
+        Args:
+            bot: Telegram bot used to resolve the file
+            file_id: Telegram file ID
+
+        Returns:
+            Readable binary file with the photo; the caller closes it
+        """
+        async with self._downloads:
+            file = await bot.get_file(file_id)
+            if urlparse(file.file_path).scheme not in ('http', 'https'):
+                # A local Bot API server already stores the file on disk
+                return open(file.file_path, 'rb')
+
+            if self.session is None:
+                raise RuntimeError("MediaPipeline.start() must be called before transferring photos")
+            spool: BinaryIO = io.BytesIO()
+            try:
+                async with self.session.get(file.file_path) as resp:
+                    resp.raise_for_status()
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        spool.write(chunk)
+                        if isinstance(spool, io.BytesIO) and spool.tell() > self.spool_size:
+                            spool = self._spill(spool)
+            except BaseException:
+                spool.close()
+                raise
+            return spool
+
+    @staticmethod
+    def _spill(buffer: io.BytesIO) -> BinaryIO:
+        """
+        Move an in-memory spool to a named temporary file.
+
+        The file has a path, so the image optimizer's worker processes can
+        read it without the photo passing through this process's memory.
+        It is deleted when closed.
+        """
+        spool = tempfile.NamedTemporaryFile(prefix='telegram-photo-')
+        spool.write(buffer.getbuffer())
+        buffer.close()
+        return spool
+
+    @staticmethod
+    async def _read_chunks(source: BinaryIO) -> AsyncIterator[bytes]:
+        """Yield a file's content in chunks."""
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    async def _upload(self, source: BinaryIO, filename: str, content_type: str) -> Optional[Dict[str, Any]]:
+        """Stream one image from the start of a file to WordPress."""
+        size = source.seek(0, os.SEEK_END)
+        source.seek(0)
+        async with self._uploads:
+            return await self.wp_handler.upload_image(
+                self._read_chunks(source),
+                filename + EXTENSIONS.get(content_type, ''),
+                size,
+                content_type
+            )
+
+    async def transfer(self, bot: Any, file_id: str, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Move one photo from Telegram to WordPress, retrying each stage.
+
+        Args:
+            bot: Telegram bot used for the download
+            file_id: Telegram file ID
+            filename: Name for the uploaded file, without extension
+
+        Returns:
+            Media details if successful, None otherwise
+        """
+        source = None
+        try:
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
+                try:
+                    if source is None:
+                        downloaded = await self._download(bot, file_id)
+                        try:
+                            prepared = await self.optimizer.process(downloaded)
+                        except Exception:
+                            downloaded.close()
+                            raise
+                        source, content_type = prepared
+                    result = await self._upload(source, filename, content_type)
+                    if result:
+                        return result
+                except Exception as e:
+                    print(f"❌ Photo transfer failed (attempt {attempt + 1}): {e}")
+            return None
+        finally:
+            if source is not None:
+                source.close()
+
+    def submit(self, bot: Any, file_id: str, filename: str) -> UploadTask:
+        """
+        Start transferring a photo in the background.
+
+        Args:
+            bot: Telegram bot used for the download
+            file_id: Telegram file ID
+            filename: Name for the uploaded file, without extension
+
+        Returns:
+            Task resolving to the media details, or None if the photo failed
+        """
+        return asyncio.create_task(self.transfer(bot, file_id, filename))
+
+    async def collect(
+        self,
+        tasks: List[UploadTask],
+        on_progress: Optional[ProgressCallback] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Wait for submitted transfers.
+
+        Args:
+            tasks: Tasks from submit() in gallery order
+            on_progress: Awaited with (finished, total) while transfers are still running
+
+        Returns:
+            Media details in gallery order, None for photos that failed
+        """
+        pending = [task for task in tasks if not task.done()]
+        finished = len(tasks) - len(pending)
+        if on_progress and pending:
+            await on_progress(finished, len(tasks))
+        for next_done in asyncio.as_completed(pending):
+            await next_done
+            finished += 1
+            if on_progress:
+                await on_progress(finished, len(tasks))
+        return [task.result() for task in tasks]
+
+    def discard(self, tasks: List[UploadTask]) -> None:
+        """
+        Delete the media of an abandoned post from WordPress.
+
+        Runs in the background, so the conversation is not blocked while
+        transfers that are still running finish and get deleted.
+
+        Args:
+            tasks: Tasks from submit()
+        """
+        if not tasks:
+            return
+        cleanup = asyncio.create_task(self._delete_uploaded(tasks))
+        self._background.add(cleanup)
+        cleanup.add_done_callback(self._background.discard)
+
+    async def _delete_uploaded(self, tasks: List[UploadTask]) -> None:
+        """Wait for transfers and delete every uploaded media item."""
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        media_ids = [media['id'] for media in results if isinstance(media, dict) and media.get('id')]
+        for media_id in media_ids:
+            await self.wp_handler.delete_media(media_id)
+        if media_ids:
+            print(f"🗑 Deleted {len(media_ids)} uploaded photos of a cancelled post")
+
+    async def close(self) -> None:
+        """Wait for background cleanups, close the download session and stop the optimizer; call before the WordPress session closes."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+        self.optimizer.close()
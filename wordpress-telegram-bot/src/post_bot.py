@@ -14,10 +14,13 @@ from telegram.ext import (
     MessageHandler,
     CallbackQueryHandler,
     ConversationHandler,
+    TypeHandler,
     filters
 )
 
 from wp_handler import WordPressHandler
+from media_pipeline import MediaPipeline
+from image_optimizer import ImageOptimizer
 from utils import load_config, sanitize_slug, validate_image, format_preview
 
 # Conversation states
@@ -32,6 +35,18 @@ class WordPressTelegramBot:
             self.config['wp_username'],
             self.config['wp_password']
         )
+        self.media_pipeline = MediaPipeline(
+            self.wp_handler,
+            download_concurrency=self.config['media_concurrency'],
+            upload_concurrency=self.config['media_concurrency'],
+            retries=self.config['media_retries'],
+            optimizer=ImageOptimizer(
+                enabled=self.config['optimize_images'],
+                output_format=self.config['image_format'],
+                max_dimension=self.config['image_max_dimension'],
+                quality=self.config['image_quality']
+            )
+        )
         self.user_posts: Dict[int, Dict[str, Any]] = {}
 
     async def start(self, update: Update, context: Any) -> int:
@@ -50,12 +65,16 @@ class WordPressTelegramBot:
             await update.message.reply_text("❌ You don't have access to this bot")
             return ConversationHandler.END
 
+        self._discard_post(user_id)
         self.user_posts[user_id] = {
             'title': '',
             'content': '',
             'photo_ids': [],
+            # Background uploads, one per photo in photo_ids
+            'uploads': [],
             'url_slug': '',
-            'user_id': user_id
+            'user_id': user_id,
+            'created': int(datetime.now().timestamp())
         }
         
         await update.message.reply_text(
@@ -127,9 +146,16 @@ class WordPressTelegramBot:
                 await update.message.reply_text(error)
                 return PHOTOS
                 
-            self.user_posts[user_id]['photo_ids'].append(photo.file_id)
+            post_data = self.user_posts[user_id]
+            post_data['photo_ids'].append(photo.file_id)
+            # Upload right away, while the user is still composing the post
+            post_data['uploads'].append(self.media_pipeline.submit(
+                context.bot,
+                photo.file_id,
+                f"post-image-{post_data['created']}-{len(post_data['photo_ids'])}"
+            ))
             await update.message.reply_text(
-                f"✅ Photo #{len(self.user_posts[user_id]['photo_ids'])} added!\n"
+                f"✅ Photo #{len(post_data['photo_ids'])} added!\n"
                 "Send more photos or use /done to continue."
             )
             return PHOTOS
@@ -193,18 +219,27 @@ class WordPressTelegramBot:
             try:
                 post_data = self.user_posts[user_id]
                 
-                # Upload images
-                media_info = []
-                for file_id in post_data['photo_ids']:
-                    file = await context.bot.get_file(file_id)
-                    async with context.bot.get_file_download(file.file_id) as file_content:
-                        image_data = await file_content.read()
-                        upload_result = await self.wp_handler.upload_image(
-                            image_data,
-                            f"post-image-{datetime.now().timestamp()}.jpg"
+                # Photos were uploaded in the background as they arrived;
+                # only wait for the ones still in flight, in gallery order
+                photo_count = len(post_data['photo_ids'])
+                uploading = not all(task.done() for task in post_data['uploads'])
+
+                async def show_progress(finished: int, total: int) -> None:
+                    try:
+                        await query.edit_message_text(
+                            f"⏳ Uploading photos: {finished}/{total}..."
                         )
-                        if upload_result:
-                            media_info.append(upload_result)
+                    except Exception as e:
+                        print(f"⚠️ Could not update progress: {e}")
+
+                uploads = await self.media_pipeline.collect(
+                    post_data['uploads'],
+                    show_progress
+                )
+                media_info = [media for media in uploads if media]
+                failed = photo_count - len(media_info)
+                if uploading:
+                    await query.edit_message_text("⏳ Publishing post to website...")
 
                 # Create post
                 result = await self.wp_handler.create_post(
@@ -215,10 +250,12 @@ class WordPressTelegramBot:
                 )
 
                 if result:
+                    warning = f"\n⚠️ {failed} of {photo_count} photos could not be uploaded" if failed else ""
                     await query.edit_message_text(
                         f"🎉 Post published successfully!\n\n"
                         f"🔗 Link: {result['link']}\n"
                         f"📊 Post ID: {result['id']}"
+                        f"{warning}"
                     )
                 else:
                     await query.edit_message_text(
@@ -226,24 +263,57 @@ class WordPressTelegramBot:
                     )
             except Exception as e:
                 await query.edit_message_text(f"❌ Error: {str(e)}")
+            self.user_posts.pop(user_id, None)
         elif query.data == "cancel":
+            self._discard_post(user_id)
             await query.edit_message_text("❌ Post creation cancelled")
 
-        if user_id in self.user_posts:
-            del self.user_posts[user_id]
         return ConversationHandler.END
 
     async def cancel(self, update: Update, context: Any) -> int:
         """Cancel post creation."""
         user_id = update.effective_user.id
-        if user_id in self.user_posts:
-            del self.user_posts[user_id]
+        self._discard_post(user_id)
         await update.message.reply_text("❌ Post creation cancelled")
         return ConversationHandler.END
 
+    async def timeout(self, update: Update, context: Any) -> int:
+        """Drop a post that was left unfinished for conversation_timeout seconds."""
+        self._discard_post(update.effective_user.id)
+        if update.effective_chat:
+            await context.bot.send_message(
+                update.effective_chat.id,
+                "⌛ Post creation timed out. Use /start to begin again."
+            )
+        return ConversationHandler.END
+
+    def _discard_post(self, user_id: int) -> None:
+        """Forget a user's unpublished post and delete its uploaded photos."""
+        post_data = self.user_posts.pop(user_id, None)
+        if post_data:
+            self.media_pipeline.discard(post_data['uploads'])
+
+    async def post_init(self, application: Application) -> None:
+        """Open the WordPress and Telegram download connection pools once the event loop is running."""
+        await self.wp_handler.start()
+        await self.media_pipeline.start()
+
+    async def post_shutdown(self, application: Application) -> None:
+        """Finish media cleanups and close the connection pools."""
+        for user_id in list(self.user_posts):
+            self._discard_post(user_id)
+        await self.media_pipeline.close()
+        await self.wp_handler.close()
+
     def run(self):
         """Start the bot."""
-        application = Application.builder().token(self.config['bot_token']).build()
+        application = (
+            Application.builder()
+            .token(self.config['bot_token'])
+            .post_init(self.post_init)
+            .post_shutdown(self.post_shutdown)
+            .build()
+        )
 
         # Create conversation handler
         conv_handler = ConversationHandler(
@@ -277,9 +347,14 @@ class WordPressTelegramBot:
                 ],
                 CONFIRM: [
                     CallbackQueryHandler(self.handle_confirmation)
+                ],
+                # Abandoned posts would otherwise keep their eagerly uploaded photos
+                ConversationHandler.TIMEOUT: [
+                    TypeHandler(Update, self.timeout)
                 ]
             },
             fallbacks=[CommandHandler('cancel', self.cancel)],
+            conversation_timeout=self.config['conversation_timeout'] or None,
             per_user=True,
             per_chat=True
         )
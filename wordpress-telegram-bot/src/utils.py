@@ -37,7 +37,14 @@ def load_config() -> dict:
         'wp_url': os.getenv('WORDPRESS_URL'),
         'wp_username': os.getenv('WORDPRESS_USERNAME'),
         'wp_password': os.getenv('WORDPRESS_APP_PASSWORD'),
-        'allowed_users': allowed_users
+        'allowed_users': allowed_users,
+        'media_concurrency': int(os.getenv('MEDIA_CONCURRENCY', '3')),
+        'media_retries': int(os.getenv('MEDIA_RETRIES', '2')),
+        'conversation_timeout': int(os.getenv('CONVERSATION_TIMEOUT', '3600')),
+        'optimize_images': os.getenv('OPTIMIZE_IMAGES', 'false').lower() in ('1', 'true', 'yes'),
+        'image_format': os.getenv('IMAGE_FORMAT', 'webp').lower(),
+        'image_max_dimension': int(os.getenv('IMAGE_MAX_DIMENSION', '2048')),
+        'image_quality': int(os.getenv('IMAGE_QUALITY', '82'))
     }
 
 def sanitize_slug(text: str) -> str:
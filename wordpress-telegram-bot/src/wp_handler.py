@@ -5,58 +5,137 @@ Handles all interactions with the WordPress REST API
 
 import base64
 import aiohttp
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterable, Dict, Any, Optional, List, Union
 
 class WordPressHandler:
-    def __init__(self, wp_url: str, username: str, app_password: str):
+    def __init__(
+        self,
+        wp_url: str,
+        username: str,
+        app_password: str,
+        timeout: float = 120,
+        limit_per_host: int = 4
+    ):
         """
         Initialize WordPress handler with credentials.
         
+        The HTTP session is opened by start() and shared by all requests,
+        so uploads and posts reuse warm keep-alive connections.
+        
         Args:
             wp_url: WordPress site URL
             username: WordPress username
             app_password: WordPress application password
+            timeout: Total request timeout in seconds
+            limit_per_host: Maximum parallel connections to the WordPress host
         """
         self.wp_url = wp_url.rstrip('/')
         self.api_url = f"{self.wp_url}/wp-json/wp/v2"
         self.auth = base64.b64encode(
             f"{username}:{app_password}".encode()
         ).decode()
+        self.timeout = timeout
+        self.limit_per_host = limit_per_host
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self) -> None:
+        """Open the shared session; must be called from the running event loop."""
+        if self.session is not None:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            headers={'Authorization': f'Basic {self.auth}'},
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+
+    async def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        """Return the shared session, failing clearly if start() was not called."""
+        if self.session is None:
+            raise RuntimeError("WordPressHandler.start() must be called before making requests")
+        return self.session
 
-    async def upload_image(self, image_data: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    async def upload_image(
+        self,
+        image: Union[bytes, AsyncIterable[bytes]],
+        filename: str,
+        size: Optional[int] = None,
+        content_type: str = 'image/jpeg'
+    ) -> Optional[Dict[str, Any]]:
         """
         Upload an image to WordPress.
         
+        A stream is sent chunk by chunk as it is read, so the image is never
+        held in memory as a whole.
+        
         Args:
-            image_data: Raw image bytes
+            image: Raw image bytes, or an async iterator of byte chunks
             filename: Name for the uploaded file
+            size: Length of a streamed image in bytes; without it the
+                upload uses chunked transfer encoding
+            content_type: MIME type of the image
             
         Returns:
             Dictionary containing media details if successful, None otherwise
         """
         try:
             headers = {
-                'Authorization': f'Basic {self.auth}',
-                'Content-Type': 'image/jpeg',
+                'Content-Type': content_type,
                 'Content-Disposition': f'attachment; filename="{filename}"'
             }
+            if size is not None and not isinstance(image, bytes):
+                headers['Content-Length'] = str(size)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/media",
-                    data=image_data,
-                    headers=headers
-                ) as resp:
-                    if resp.status == 201:
-                        return await resp.json()
-                    else:
-                        print(f"❌ Media upload failed! Status: {resp.status}")
-                        print(f"Response: {await resp.text()}")
-                        return None
+            async with self._session().post(
+                f"{self.api_url}/media",
+                data=image,
+                headers=headers
+            ) as resp:
+                if resp.status == 201:
+                    return await resp.json()
+                else:
+                    print(f"❌ Media upload failed! Status: {resp.status}")
+                    print(f"Response: {await resp.text()}")
+                    return None
         except Exception as e:
             print(f"❌ Exception in upload_image: {e}")
             return None
 
+    async def delete_media(self, media_id: int) -> bool:
+        """
+        Permanently delete an uploaded media item.
+        
+        Args:
+            media_id: WordPress media ID
+            
+        Returns:
+            True if the media was deleted, False otherwise
+        """
+        try:
+            async with self._session().delete(
+                f"{self.api_url}/media/{media_id}",
+                params={'force': 'true'}
+            ) as resp:
+                if resp.status == 200:
+                    return True
+                print(f"❌ Media deletion failed! Status: {resp.status}")
+                print(f"Response: {await resp.text()}")
+                return False
+        except Exception as e:
+            print(f"❌ Exception in delete_media: {e}")
+            return False
+
     def _prepare_content(self, content: str, media_info: List[Dict[str, Any]]) -> str:
         """
         Prepare post content with media.
@@ -116,23 +195,16 @@ class WordPressHandler:
             if featured_media_id:
                 post_data['featured_media'] = featured_media_id
             
-            headers = {
-                'Authorization': f'Basic {self.auth}',
-                'Content-Type': 'application/json'
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/posts",
-                    json=post_data,
-                    headers=headers
-                ) as resp:
-                    if resp.status == 201:
-                        return await resp.json()
-                    else:
-                        print(f"❌ Post creation failed! Status: {resp.status}")
-                        print(f"Response: {await resp.text()}")
-                        return None
+            async with self._session().post(
+                f"{self.api_url}/posts",
+                json=post_data
+            ) as resp:
+                if resp.status == 201:
+                    return await resp.json()
+                else:
+                    print(f"❌ Post creation failed! Status: {resp.status}")
+                    print(f"Response: {await resp.text()}")
+                    return None
         except Exception as e:
             print(f"❌ Exception in create_post: {e}")
             return None
@@ -0,0 +1,50 @@
+import io
+import os
+import sys
+import asyncio
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from image_optimizer import ImageOptimizer
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def jpeg(size, quality):
+    """Noisy JPEG that does not compress well."""
+    output = io.BytesIO()
+    Image.effect_noise(size, 60).convert('RGB').save(output, 'JPEG', quality=quality)
+    return output.getvalue()
+
+
+def optimize(data, **settings):
+    async def run():
+        optimizer = ImageOptimizer(enabled=True, workers=1, **settings)
+        try:
+            source, mime = await optimizer.process(io.BytesIO(data))
+            return source.read(), mime
+        finally:
+            optimizer.close()
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize('output_format', ['webp', 'jpeg'])
+def test_keeps_original_when_reencoding_would_grow_it(output_format):
+    original = jpeg((400, 300), quality=30)
+
+    data, mime = optimize(original, output_format=output_format, quality=90)
+
+    assert data == original
+    assert mime == 'image/jpeg'
+
+
+def test_resized_photo_is_reencoded():
+    original = jpeg((1200, 800), quality=30)
+
+    data, mime = optimize(original, max_dimension=600)
+
+    assert mime == 'image/webp'
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.size == (600, 400)